@@ -29,5 +29,6 @@ class SyncLogAdmin(admin.ModelAdmin):
 class ValidationErrorAdmin(admin.ModelAdmin):
     list_display = ('sync_log', 'row_number', 'file_type', 'field_name',
                     'error_type', 'raw_value')
+    list_select_related = ('sync_log',)
     list_filter = ('file_type', 'error_type')
     search_fields = ('field_name', 'error_message')
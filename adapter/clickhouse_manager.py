@@ -1,20 +1,70 @@
+import atexit
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import clickhouse_connect
+from clickhouse_connect.driver import httputil
 from django.conf import settings
 
+# Shared urllib3 pool for every client in the process, sized for the
+# sync workers, profiling and request threads hitting ClickHouse at once.
+POOL_NUM_POOLS = 16
+POOL_MAXSIZE = 32
+
+_pool_lock = threading.Lock()
+_pool_mgr = None
+_pool_pid = None
+_local = threading.local()
+
+
+def _get_pool_manager():
+    """Return the process-wide pool manager, recreating it after a fork."""
+    global _pool_mgr, _pool_pid
+    pid = os.getpid()
+    if _pool_pid != pid:
+        with _pool_lock:
+            if _pool_pid != pid:
+                _pool_mgr = httputil.get_pool_manager(
+                    num_pools=POOL_NUM_POOLS, maxsize=POOL_MAXSIZE,
+                )
+                atexit.register(_pool_mgr.clear)
+                _pool_pid = pid
+    return _pool_mgr
+
 
 def get_clickhouse_client(database='default'):
-    """Create a ClickHouse client connection for the given database."""
-    return clickhouse_connect.get_client(
-        host=settings.CLICKHOUSE_HOST,
-        port=settings.CLICKHOUSE_PORT,
-        username=settings.CLICKHOUSE_USER,
-        password=settings.CLICKHOUSE_PASSWORD,
-        database=database,
-    )
+    """
+    Return a ClickHouse client for the given database.
+
+    Clients are cached per thread and database: a client carries a session
+    that rejects concurrent queries, so it cannot be shared across threads,
+    but reusing it within a thread skips the connect-time server queries.
+    All clients share one pooled set of HTTP connections.
+    """
+    pool_mgr = _get_pool_manager()
+    clients = getattr(_local, 'clients', None)
+    if clients is None or _local.pid != _pool_pid:
+        clients = _local.clients = {}
+        _local.pid = _pool_pid
+    client = clients.get(database)
+    if client is None:
+        client = clients[database] = clickhouse_connect.get_client(
+            host=settings.CLICKHOUSE_HOST,
+            port=settings.CLICKHOUSE_PORT,
+            username=settings.CLICKHOUSE_USER,
+            password=settings.CLICKHOUSE_PASSWORD,
+            database=database,
+            pool_mgr=pool_mgr,
+            # Staging loads are wide 50k-row blocks; LZ4 roughly halves
+            # the bytes on the wire for a negligible CPU cost.
+            compress='lz4',
+        )
+    return client
 
 
 FACT_CREDIT_DDL = """
-CREATE TABLE IF NOT EXISTS fact_credit (
+CREATE TABLE IF NOT EXISTS {database}.fact_credit (
     batch_id                        UUID,
     loan_type                       LowCardinality(String),
     loaded_at                       DateTime DEFAULT now(),
@@ -31,11 +81,11 @@ CREATE TABLE IF NOT EXISTS fact_credit (
     first_payment_date              Nullable(Date),
     original_loan_amount            Decimal(18, 2),
     outstanding_principal_balance   Decimal(18, 2),
-    nominal_interest_rate           Decimal(10, 6),
+    nominal_interest_rate           Decimal32(6),
     total_interest_amount           Decimal(18, 2) DEFAULT 0,
-    kkdf_rate                       Decimal(10, 6) DEFAULT 0,
+    kkdf_rate                       Decimal32(6) DEFAULT 0,
     kkdf_amount                     Decimal(18, 2) DEFAULT 0,
-    bsmv_rate                       Decimal(10, 6) DEFAULT 0,
+    bsmv_rate                       Decimal32(6) DEFAULT 0,
     bsmv_amount                     Decimal(18, 2) DEFAULT 0,
     grace_period_months             UInt32 DEFAULT 0,
     installment_frequency           UInt32 DEFAULT 1,
@@ -48,13 +98,15 @@ CREATE TABLE IF NOT EXISTS fact_credit (
     customer_region_code            Nullable(String),
     sector_code                     Nullable(UInt32),
     internal_credit_rating          Nullable(UInt32),
-    default_probability             Nullable(Decimal(10, 6)),
+    default_probability             Nullable(Decimal32(6)),
     risk_class                      Nullable(UInt32),
     customer_segment                Nullable(UInt32),
 
     insurance_included              Nullable(UInt8),
     customer_district_code          Nullable(String),
-    customer_province_code          Nullable(String)
+    customer_province_code          Nullable(String),
+
+    INDEX idx_batch_id batch_id TYPE minmax GRANULARITY 1
 )
 ENGINE = ReplacingMergeTree(loaded_at)
 PARTITION BY loan_type
@@ -63,7 +115,7 @@ SETTINGS index_granularity = 8192
 """
 
 FACT_PAYMENT_DDL = """
-CREATE TABLE IF NOT EXISTS fact_payment (
+CREATE TABLE IF NOT EXISTS {database}.fact_payment (
     batch_id                UUID,
     loan_type               LowCardinality(String),
     loaded_at               DateTime DEFAULT now(),
@@ -81,7 +133,9 @@ CREATE TABLE IF NOT EXISTS fact_payment (
     remaining_principal     Decimal(18, 2) DEFAULT 0,
     remaining_interest      Decimal(18, 2) DEFAULT 0,
     remaining_kkdf          Decimal(18, 2) DEFAULT 0,
-    remaining_bsmv          Decimal(18, 2) DEFAULT 0
+    remaining_bsmv          Decimal(18, 2) DEFAULT 0,
+
+    INDEX idx_batch_id batch_id TYPE minmax GRANULARITY 1
 )
 ENGINE = ReplacingMergeTree(loaded_at)
 PARTITION BY loan_type
@@ -90,35 +144,122 @@ SETTINGS index_granularity = 8192
 """
 
 
+# Staging tables: same schema but plain MergeTree (no deduplication).
+# ReplacingMergeTree on staging causes data loss during background
+# merges before REPLACE PARTITION can move data to fact tables.
+STAGING_CREDIT_DDL = FACT_CREDIT_DDL.replace(
+    'fact_credit', 'staging_credit'
+).replace(
+    'ReplacingMergeTree(loaded_at)', 'MergeTree()'
+)
+STAGING_PAYMENT_DDL = FACT_PAYMENT_DDL.replace(
+    'fact_payment', 'staging_payment'
+).replace(
+    'ReplacingMergeTree(loaded_at)', 'MergeTree()'
+)
+
+# Tables created in every tenant database. The DDLs are templates on
+# {database} so one client can target any tenant without reconnecting.
+# ClickHouse's HTTP interface accepts a single statement per request,
+# so these stay separate commands.
+TENANT_TABLE_DDLS = (
+    FACT_CREDIT_DDL,
+    FACT_PAYMENT_DDL,
+    STAGING_CREDIT_DDL,
+    STAGING_PAYMENT_DDL,
+)
+
+# Rate columns are Decimal32(6) (4 bytes, |x| < 1000) instead of
+# Decimal(10, 6) (8 bytes); normalized rates are fractions, and the credit
+# validator rejects raw rates that would not fit (MAX_RATE). Brings tables
+# created before that change up to date. Fact and staging must match for
+# REPLACE PARTITION.
+_RATE_COLUMN_TABLES = ('fact_credit', 'staging_credit')
+_RATE_COLUMNS_ALTER = """
+ALTER TABLE {{database}}.{table}
+    MODIFY COLUMN nominal_interest_rate Decimal32(6),
+    MODIFY COLUMN kkdf_rate Decimal32(6) DEFAULT 0,
+    MODIFY COLUMN bsmv_rate Decimal32(6) DEFAULT 0,
+    MODIFY COLUMN default_probability Nullable(Decimal32(6))
+"""
+
+# idx_batch_id lets batch-scoped reads (WHERE batch_id = ...) skip
+# granules: a loan_type partition is swapped in whole from one batch, so
+# the min/max per granule is a single UUID. It replaces the proj_batch
+# projection, which kept a second full copy of every part. Staging must
+# carry the same index because REPLACE PARTITION requires both tables to
+# match.
+_BATCH_INDEX_TABLES = ('fact_credit', 'fact_payment', 'staging_credit', 'staging_payment')
+
 TENANT_DBS = ['bank001_dw', 'bank002_dw', 'bank003_dw']
 
 
-def init_clickhouse_databases():
-    """Create all tenant ClickHouse databases and tables."""
-    client = get_clickhouse_client(database='default')
+def _upgrade_rate_columns(client, db_name):
+    """
+    Narrow the rate columns of tables created with Decimal(10, 6).
 
-    for db_name in TENANT_DBS:
-        client.command(f"CREATE DATABASE IF NOT EXISTS {db_name}")
+    MODIFY COLUMN starts a mutation that rewrites every part, so it is
+    only issued for tables whose system.columns still show the old type.
+    """
+    result = client.query(
+        "SELECT DISTINCT table FROM system.columns "
+        "WHERE database = {db:String} AND has({tables:Array(String)}, table) "
+        "AND name = 'nominal_interest_rate' AND type = 'Decimal(10, 6)'",
+        parameters={'db': db_name, 'tables': list(_RATE_COLUMN_TABLES)},
+    )
+    for (table,) in result.result_rows:
+        client.command(_RATE_COLUMNS_ALTER.format(table=table).format(database=db_name))
 
-        db_client = get_clickhouse_client(database=db_name)
 
-        db_client.command(FACT_CREDIT_DDL)
-        db_client.command(FACT_PAYMENT_DDL)
+def _upgrade_batch_index(client, db_name):
+    """
+    Move tables created with proj_batch to idx_batch_id.
 
-        # Staging tables: same schema but plain MergeTree (no deduplication).
-        # ReplacingMergeTree on staging causes data loss during background
-        # merges before REPLACE PARTITION can move data to fact tables.
-        staging_credit_ddl = FACT_CREDIT_DDL.replace(
-            'fact_credit', 'staging_credit'
-        ).replace(
-            'ReplacingMergeTree(loaded_at)', 'MergeTree()'
-        )
-        staging_payment_ddl = FACT_PAYMENT_DDL.replace(
-            'fact_payment', 'staging_payment'
-        ).replace(
-            'ReplacingMergeTree(loaded_at)', 'MergeTree()'
-        )
-        db_client.command(staging_credit_ddl)
-        db_client.command(staging_payment_ddl)
+    Only tables that still lack the index (system.data_skipping_indices)
+    or still declare the projection (system.tables) are altered, and the
+    index is materialized for the parts written before it existed.
+    """
+    params = {'db': db_name, 'tables': list(_BATCH_INDEX_TABLES)}
+    indexed = {row[0] for row in client.query(
+        "SELECT table FROM system.data_skipping_indices "
+        "WHERE database = {db:String} AND has({tables:Array(String)}, table) "
+        "AND name = 'idx_batch_id'",
+        parameters=params,
+    ).result_rows}
+    projected = {row[0] for row in client.query(
+        "SELECT name FROM system.tables "
+        "WHERE database = {db:String} AND has({tables:Array(String)}, name) "
+        "AND position(create_table_query, 'PROJECTION proj_batch') > 0",
+        parameters=params,
+    ).result_rows}
+    for table in _BATCH_INDEX_TABLES:
+        if table in projected:
+            client.command(f"ALTER TABLE {db_name}.{table} DROP PROJECTION IF EXISTS proj_batch")
+        if table not in indexed:
+            client.command(
+                f"ALTER TABLE {db_name}.{table} ADD INDEX IF NOT EXISTS "
+                f"idx_batch_id batch_id TYPE minmax GRANULARITY 1"
+            )
+            client.command(f"ALTER TABLE {db_name}.{table} MATERIALIZE INDEX idx_batch_id")
+
+
+def _init_one_tenant(db_name):
+    """Create a single tenant database and its tables over one connection."""
+    client = get_clickhouse_client(database='default')
+    client.command(f"CREATE DATABASE IF NOT EXISTS {db_name}")
+    for ddl in TENANT_TABLE_DDLS:
+        client.command(ddl.format(database=db_name))
+    _upgrade_rate_columns(client, db_name)
+    _upgrade_batch_index(client, db_name)
+
+
+def init_clickhouse_databases():
+    """
+    Create all tenant ClickHouse databases and tables.
 
-    client.close()
+    Tenants are independent, so each one is initialized on its own worker
+    thread with that thread's client; wall time is bounded by the slowest tenant.
+    """
+    with ThreadPoolExecutor(max_workers=len(TENANT_DBS)) as executor:
+        # list() re-raises the first worker exception, if any
+        list(executor.map(_init_one_tenant, TENANT_DBS))
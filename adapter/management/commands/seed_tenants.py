@@ -1,9 +1,10 @@
 import secrets
 
-from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from adapter.models import Tenant, SyncConfiguration
+from api.hashers import make_api_key_hash
 from config.db_router import set_current_tenant_schema, clear_current_tenant_schema
 
 
@@ -30,31 +31,59 @@ TENANTS = [
 
 EXTERNAL_BANK_URL = 'http://web:8000/bank/api'
 
+LOAN_TYPES = ['RETAIL', 'COMMERCIAL']
+
+API_KEY_PREFIX = 'sk_live_'
+API_KEY_BYTES = 24
+
 
 class Command(BaseCommand):
     help = 'Seed the 3 tenants (BANK001, BANK002, BANK003) with API keys and sync configs'
 
     def handle(self, *args, **options):
-        for tenant_data in TENANTS:
-            tenant, created = Tenant.objects.get_or_create(
-                tenant_id=tenant_data['tenant_id'],
-                defaults={
-                    'name': tenant_data['name'],
-                    'pg_schema': tenant_data['pg_schema'],
-                    'ch_database': tenant_data['ch_database'],
-                    'api_key_hash': '',
-                    'api_key_prefix': '',
-                },
+        with transaction.atomic():
+            self._seed()
+
+        self.stdout.write(self.style.SUCCESS("Tenant seeding complete."))
+
+    def _seed(self):
+        existing = {
+            tenant.tenant_id: tenant
+            for tenant in Tenant.objects.filter(
+                tenant_id__in=[t['tenant_id'] for t in TENANTS],
             )
+        }
+
+        # Build all missing tenants up front and insert them in one statement
+        missing = [t for t in TENANTS if t['tenant_id'] not in existing]
+        # Draw the entropy for every new key in one urandom call
+        entropy = secrets.token_bytes(API_KEY_BYTES * len(missing))
+        raw_api_keys = {}
+        new_tenants = []
+        for i, tenant_data in enumerate(missing):
+            offset = i * API_KEY_BYTES
+            raw_api_key = API_KEY_PREFIX + entropy[offset:offset + API_KEY_BYTES].hex()
+            raw_api_keys[tenant_data['tenant_id']] = raw_api_key
+            new_tenants.append(Tenant(
+                tenant_id=tenant_data['tenant_id'],
+                name=tenant_data['name'],
+                pg_schema=tenant_data['pg_schema'],
+                ch_database=tenant_data['ch_database'],
+                api_key_hash=make_api_key_hash(raw_api_key),
+                api_key_prefix=raw_api_key[:16],
+            ))
+        created = {
+            tenant.tenant_id: tenant
+            for tenant in Tenant.objects.bulk_create(new_tenants)
+        }
 
-            if created:
-                raw_api_key = f"sk_live_{secrets.token_hex(24)}"
-                tenant.api_key_hash = make_password(raw_api_key)
-                tenant.api_key_prefix = raw_api_key[:16]
-                tenant.save()
+        for tenant_data in TENANTS:
+            tenant_id = tenant_data['tenant_id']
+            if tenant_id in created:
+                tenant = created[tenant_id]
                 self.stdout.write(
                     self.style.SUCCESS(
-                        f"Created {tenant.tenant_id}: API key = {raw_api_key}"
+                        f"Created {tenant_id}: API key = {raw_api_keys[tenant_id]}"
                     )
                 )
                 self.stdout.write(
@@ -63,33 +92,36 @@ class Command(BaseCommand):
                     )
                 )
             else:
+                tenant = existing[tenant_id]
                 self.stdout.write(
                     self.style.NOTICE(
-                        f"Tenant {tenant.tenant_id} already exists (prefix: {tenant.api_key_prefix}...)"
+                        f"Tenant {tenant_id} already exists (prefix: {tenant.api_key_prefix}...)"
                     )
                 )
 
             # Create sync configurations in the tenant's schema
             self._create_sync_configs(tenant)
 
-        self.stdout.write(self.style.SUCCESS("Tenant seeding complete."))
-
     def _create_sync_configs(self, tenant):
         """Create RETAIL and COMMERCIAL sync configs in the tenant's schema."""
         set_current_tenant_schema(tenant.pg_schema)
         try:
-            for loan_type in ['RETAIL', 'COMMERCIAL']:
-                _, created = SyncConfiguration.objects.get_or_create(
+            existing = set(
+                SyncConfiguration.objects.values_list('loan_type', flat=True)
+            )
+            missing = [lt for lt in LOAN_TYPES if lt not in existing]
+            SyncConfiguration.objects.bulk_create([
+                SyncConfiguration(
                     loan_type=loan_type,
-                    defaults={
-                        'external_bank_url': EXTERNAL_BANK_URL,
-                        'sync_interval_minutes': 60,
-                        'is_enabled': True,
-                    },
+                    external_bank_url=EXTERNAL_BANK_URL,
+                    sync_interval_minutes=60,
+                    is_enabled=True,
+                )
+                for loan_type in missing
+            ])
+            for loan_type in missing:
+                self.stdout.write(
+                    f"  Created {loan_type} sync config for {tenant.tenant_id}"
                 )
-                if created:
-                    self.stdout.write(
-                        f"  Created {loan_type} sync config for {tenant.tenant_id}"
-                    )
         finally:
             clear_current_tenant_schema()
@@ -6,7 +6,7 @@ then creates tenant-specific tables (sync_configurations, sync_logs,
 validation_errors) in each schema.
 """
 from django.core.management.base import BaseCommand
-from django.db import connection
+from django.db import connection, transaction
 
 
 TENANT_SCHEMAS = ['bank001', 'bank002', 'bank003']
@@ -62,22 +62,23 @@ class Command(BaseCommand):
     help = 'Create tenant schemas and tables in PostgreSQL'
 
     def handle(self, *args, **options):
-        with connection.cursor() as cursor:
-            for schema in TENANT_SCHEMAS:
-                # Create schema
-                cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
-                self.stdout.write(f"Schema '{schema}' ensured.")
+        statements = []
+        for schema in TENANT_SCHEMAS:
+            quoted = connection.ops.quote_name(schema)
+            statements.append(f"CREATE SCHEMA IF NOT EXISTS {quoted};")
+            # SET LOCAL is scoped to the transaction, so search_path reverts
+            # on commit and needs no explicit reset.
+            statements.append(f"SET LOCAL search_path TO {quoted}, public;")
+            statements.append(TENANT_TABLES_SQL)
 
-                # Set search_path to create tables in tenant schema
-                cursor.execute(f"SET search_path TO {schema}, public")
+        # All schemas in a single transaction and a single round-trip
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("\n".join(statements))
 
-                # Create tenant-specific tables
-                cursor.execute(TENANT_TABLES_SQL)
-                self.stdout.write(
-                    self.style.SUCCESS(f"  Tables created in schema '{schema}'")
-                )
-
-            # Reset search_path
-            cursor.execute("SET search_path TO public")
+        for schema in TENANT_SCHEMAS:
+            self.stdout.write(f"Schema '{schema}' ensured.")
+            self.stdout.write(
+                self.style.SUCCESS(f"  Tables created in schema '{schema}'")
+            )
 
         self.stdout.write(self.style.SUCCESS("All tenant schemas set up successfully."))
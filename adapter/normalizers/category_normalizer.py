@@ -30,6 +30,19 @@ class CategoryNormalizer:
 
     def normalize_credit(self, record: dict, loan_type: str) -> dict:
         """Normalize category fields in a credit record."""
+        return self.get_credit_normalizer(loan_type)(record)
+
+    def get_credit_normalizer(self, loan_type: str):
+        """
+        Return the credit normalizer specialized for loan_type.
+
+        Resolve it once per batch so the loan_type branch is not paid per row.
+        """
+        if loan_type == 'RETAIL':
+            return self._normalize_credit_retail
+        return self._normalize_credit_base
+
+    def _normalize_credit_base(self, record: dict) -> dict:
         # Customer type
         raw_ct = record.get('customer_type', '').strip()
         record['customer_type'] = self.CUSTOMER_TYPE_MAP.get(raw_ct, raw_ct)
@@ -38,16 +51,20 @@ class CategoryNormalizer:
         raw_status = record.get('loan_status_code', '').strip()
         record['loan_status_code'] = self.STATUS_MAP.get(raw_status, raw_status)
 
-        # Insurance (retail only)
-        if loan_type == 'RETAIL':
-            raw_ins = record.get('insurance_included', '').strip()
-            record['insurance_included'] = self.INSURANCE_MAP.get(raw_ins, None)
-
         # Remove loan_status_flag (duplicate of loan_status_code)
         record.pop('loan_status_flag', None)
 
         return record
 
+    def _normalize_credit_retail(self, record: dict) -> dict:
+        self._normalize_credit_base(record)
+
+        # Insurance (retail only)
+        raw_ins = record.get('insurance_included', '').strip()
+        record['insurance_included'] = self.INSURANCE_MAP.get(raw_ins, None)
+
+        return record
+
     def normalize_payment(self, record: dict) -> dict:
         """Normalize category fields in a payment record."""
         raw_status = record.get('installment_status', '').strip()
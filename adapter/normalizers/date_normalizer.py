@@ -1,5 +1,50 @@
 """Date normalization: converts various date formats to YYYY-MM-DD."""
 from datetime import date
+from functools import lru_cache
+
+
+def _parse_dashed(value: str) -> date:
+    return date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+
+
+def _parse_compact(value: str) -> date:
+    return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+
+
+def normalize_date(value) -> date | None:
+    """
+    Parse a YYYYMMDD / YYYY-MM-DD string into a date (None if empty/invalid).
+
+    Non-string values are converted to text first, so the cache only ever
+    sees strings and an unhashable value cannot raise TypeError.
+    """
+    if not value:
+        return None
+    return _normalize_date_text(value if type(value) is str else str(value))
+
+
+@lru_cache(maxsize=65536, typed=True)
+def _normalize_date_text(value: str) -> date | None:
+    # Memoized: bank exports repeat the same handful of dates across many
+    # rows, and the returned date objects are immutable.
+    value = value.strip()
+    if not value:
+        return None
+
+    # Already YYYY-MM-DD
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        parse = _parse_dashed
+    else:
+        # YYYYMMDD
+        value = value.replace('-', '')
+        if len(value) != 8 or not value.isdigit():
+            return None
+        parse = _parse_compact
+
+    try:
+        return parse(value)
+    except ValueError:
+        return None
 
 
 class DateNormalizer:
@@ -24,34 +69,11 @@ class DateNormalizer:
     def normalize_credit(self, record: dict) -> dict:
         """Normalize date fields in a credit record."""
         for field in self.DATE_FIELDS_CREDIT:
-            record[field] = self._normalize_date(record.get(field, ''))
+            record[field] = normalize_date(record.get(field, ''))
         return record
 
     def normalize_payment(self, record: dict) -> dict:
         """Normalize date fields in a payment record."""
         for field in self.DATE_FIELDS_PAYMENT:
-            record[field] = self._normalize_date(record.get(field, ''))
+            record[field] = normalize_date(record.get(field, ''))
         return record
-
-    def _normalize_date(self, value: str) -> date | None:
-        if not value or not value.strip():
-            return None
-
-        value = value.strip()
-
-        # Already YYYY-MM-DD
-        if len(value) == 10 and value[4] == '-' and value[7] == '-':
-            try:
-                return date(int(value[:4]), int(value[5:7]), int(value[8:10]))
-            except ValueError:
-                return None
-
-        # YYYYMMDD
-        clean = value.replace('-', '')
-        if len(clean) == 8 and clean.isdigit():
-            try:
-                return date(int(clean[:4]), int(clean[4:6]), int(clean[6:8]))
-            except ValueError:
-                return None
-
-        return None
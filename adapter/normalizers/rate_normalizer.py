@@ -1,5 +1,38 @@
 """Rate normalization: ensures all rates are in decimal form (0.0 - 1.0)."""
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+
+_ZERO = Decimal('0')
+
+
+def normalize_rate(value) -> Decimal:
+    """
+    Convert a raw rate to decimal form (percentages are divided by 100).
+
+    Non-string values are converted to text first, so only strings reach
+    the cache: 1, 1.0 and True cannot share an entry, and unhashable
+    values are rejected as invalid instead of raising TypeError.
+    """
+    if not value:
+        return _ZERO
+    return _normalize_rate_text(value if type(value) is str else str(value))
+
+
+@lru_cache(maxsize=65536, typed=True)
+def _normalize_rate_text(text: str) -> Decimal:
+    # Memoized: rate columns have very few distinct values per export, and
+    # Decimal results are immutable so cached instances can be shared.
+    text = text.strip()
+    if not text:
+        return _ZERO
+
+    try:
+        rate = Decimal(text)
+        if rate > 1:
+            rate = rate / 100
+        return rate
+    except (InvalidOperation, ValueError):
+        return _ZERO
 
 
 class RateNormalizer:
@@ -16,21 +49,11 @@ class RateNormalizer:
 
     RATE_FIELDS_COMMERCIAL = RATE_FIELDS + ['default_probability']
 
+    def rate_fields(self, loan_type: str) -> list:
+        return self.RATE_FIELDS_COMMERCIAL if loan_type == 'COMMERCIAL' else self.RATE_FIELDS
+
     def normalize_credit(self, record: dict, loan_type: str) -> dict:
         """Normalize rate fields in a credit record."""
-        fields = self.RATE_FIELDS_COMMERCIAL if loan_type == 'COMMERCIAL' else self.RATE_FIELDS
-        for field in fields:
-            record[field] = self._normalize_rate(record.get(field, ''))
+        for field in self.rate_fields(loan_type):
+            record[field] = normalize_rate(record.get(field, ''))
         return record
-
-    def _normalize_rate(self, value: str) -> Decimal:
-        if not value or not str(value).strip():
-            return Decimal('0')
-
-        try:
-            rate = Decimal(str(value).strip())
-            if rate > 1:
-                rate = rate / 100
-            return rate
-        except (InvalidOperation, ValueError):
-            return Decimal('0')
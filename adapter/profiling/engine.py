@@ -5,27 +5,37 @@ No separate cache table. ClickHouse computes min/max/avg/stddev
 directly from fact tables in milliseconds.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from adapter.clickhouse_manager import get_clickhouse_client
+from core.cache import cache_get_or_set, ch_schema_key, TTL_CH_SCHEMA
 
 logger = logging.getLogger(__name__)
 
+# Long-lived workers so each keeps its cached ClickHouse client; the pool
+# size also caps how many profiling queries one process runs at once.
+_query_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='profiling')
+
 
 class ProfilingEngine:
     """Runs profiling queries against ClickHouse fact tables."""
 
     # Meta fields excluded from completeness analysis
-    META_FIELDS = ['batch_id', 'loan_type', 'loaded_at']
+    META_FIELDS = frozenset({'batch_id', 'loan_type', 'loaded_at'})
 
     # Loan-type specific columns (used to exclude irrelevant fields)
-    RETAIL_ONLY_FIELDS = {
+    RETAIL_ONLY_FIELDS = frozenset({
         'insurance_included', 'customer_district_code', 'customer_province_code',
-    }
-    COMMERCIAL_ONLY_FIELDS = {
+    })
+    COMMERCIAL_ONLY_FIELDS = frozenset({
         'loan_product_type', 'customer_region_code', 'sector_code',
         'internal_credit_rating', 'default_probability',
         'risk_class', 'customer_segment',
-    }
+    })
+
+    # Completeness exclusions per credit loan type, built once
+    _EXCLUDE_CREDIT_RETAIL = META_FIELDS | COMMERCIAL_ONLY_FIELDS
+    _EXCLUDE_CREDIT_COMMERCIAL = META_FIELDS | RETAIL_ONLY_FIELDS
 
     NUMERIC_FIELDS_CREDIT = [
         'days_past_due', 'total_installment_count',
@@ -83,6 +93,7 @@ class ProfilingEngine:
 
     def __init__(self, ch_database: str):
         self.ch_database = ch_database
+        self._tenant_id = ch_database.replace('_dw', '').upper()
 
     def profile(self, loan_type: str, data_type: str = 'credit') -> dict:
         """
@@ -108,94 +119,171 @@ class ProfilingEngine:
             categorical_fields = self.CATEGORICAL_FIELDS_PAYMENT
             nullable_fields = self.NULLABLE_FIELDS_PAYMENT
 
+        # The categorical GROUP BY is independent of the scalar scan, so it
+        # runs on a pool worker (with that thread's own client) meanwhile.
+        categorical_future = _query_pool.submit(
+            self._get_categorical_stats_query, table, loan_type, categorical_fields,
+        )
         client = get_clickhouse_client(database=self.ch_database)
+        scalar_stats = self._get_scalar_stats(
+            client, table, loan_type, data_type, numeric_fields, nullable_fields,
+        )
 
         result = {
             'loan_type': loan_type,
             'data_type': data_type,
-            'row_count': self._get_row_count(client, table, loan_type),
-            'numeric_stats': self._get_numeric_stats(client, table, loan_type, numeric_fields),
-            'categorical_stats': self._get_categorical_stats(
-                client, table, loan_type, categorical_fields,
-            ),
-            'null_ratios': self._get_null_ratios(
-                client, table, loan_type, nullable_fields,
-            ),
-            'completeness': self._get_completeness(
-                client, table, loan_type, data_type, numeric_fields,
-            ),
+            'row_count': scalar_stats['row_count'],
+            'numeric_stats': scalar_stats['numeric_stats'],
+            'categorical_stats': categorical_future.result(),
+            'null_ratios': scalar_stats['null_ratios'],
+            'completeness': scalar_stats['completeness'],
         }
 
         return result
 
-    def _get_row_count(self, client, table: str, loan_type: str) -> int:
-        result = client.query(
-            f"SELECT count() FROM {table} WHERE loan_type = {{loan_type:String}}",
-            parameters={'loan_type': loan_type},
-        )
-        return result.result_rows[0][0]
+    def _get_scalar_stats(self, client, table: str, loan_type: str,
+                          data_type: str, numeric_fields: list,
+                          nullable_fields: list) -> dict:
+        """
+        Row count, numeric stats, null ratios and completeness in one scan.
 
-    def _get_numeric_stats(self, client, table: str, loan_type: str,
-                           fields: list) -> dict:
-        stats = {}
-        if not fields:
-            return stats
+        Each section contributes a slice of a single SELECT list; the one
+        result row is split back into the per-section dicts by offset.
+        """
+        col_data = self._get_table_columns(client, table)
+        columns = self._get_completeness_columns(
+            col_data, loan_type, data_type, numeric_fields,
+        )
+        nullable_columns = {
+            name for name, col_type in col_data if 'Nullable' in col_type
+        }
 
-        select_parts = []
-        for field in fields:
-            select_parts.extend([
+        numeric_parts = []
+        for field in numeric_fields:
+            # isNull() is constant false on non-nullable columns; only pay
+            # for it where the column can actually hold NULL.
+            if field in nullable_columns:
+                zero_or_null = f"countIf({field} = 0 OR isNull({field}))"
+            else:
+                zero_or_null = f"countIf({field} = 0)"
+            numeric_parts.extend([
                 f"min({field})",
                 f"max({field})",
                 f"avg({field})",
                 f"stddevPop({field})",
-                f"count()",
-                f"countIf({field} = 0 OR isNull({field}))",
+                zero_or_null,
             ])
+        # sum(x.null) reads only the null map subcolumn, not the values;
+        # plain Nullable(T) columns have one (LowCardinality(Nullable) not)
+        null_map_columns = {
+            name for name, col_type in col_data if col_type.startswith('Nullable(')
+        }
+        null_parts = [
+            f"sum({field}.null) / count()" if field in null_map_columns
+            else f"countIf(isNull({field})) / count()"
+            for field in nullable_fields
+        ]
+        completeness_parts = []
+        for name, col_type in columns:
+            if name in null_map_columns:
+                completeness_parts.append(f"sum({name}.null)")
+            elif 'Nullable' in col_type:
+                completeness_parts.append(f"countIf(isNull({name}))")
+            elif 'String' in col_type:
+                completeness_parts.append(f"countIf({name} = '')")
+            else:
+                # Non-nullable numeric: always filled, missing = 0
+                completeness_parts.append("0")
 
+        select_parts = ["count()", *numeric_parts, *null_parts, *completeness_parts]
         query = (
             f"SELECT {', '.join(select_parts)} "
             f"FROM {table} "
             f"WHERE loan_type = {{loan_type:String}}"
         )
-
         result = client.query(query, parameters={'loan_type': loan_type})
         if not result.result_rows:
-            return stats
+            return {
+                'row_count': 0, 'numeric_stats': {},
+                'null_ratios': {}, 'completeness': {},
+            }
 
         row = result.result_rows[0]
-        idx = 0
-        for field in fields:
-            total = row[idx + 4] if row[idx + 4] else 1
+        null_start = 1 + len(numeric_parts)
+        completeness_start = null_start + len(null_parts)
+        return {
+            'row_count': row[0],
+            'numeric_stats': self._build_numeric_stats(
+                row[0], row[1:null_start], numeric_fields,
+            ),
+            'null_ratios': {
+                field: round(self._to_float(value), 4)
+                for field, value in zip(
+                    nullable_fields, row[null_start:completeness_start],
+                )
+            },
+            'completeness': self._build_completeness(
+                row[0], row[completeness_start:], columns,
+            ),
+        }
+
+    def _build_numeric_stats(self, row_count: int, values, fields: list) -> dict:
+        stats = {}
+        total = row_count if row_count else 1
+        to_float = self._to_float
+        # Five consecutive values per field, in SELECT order
+        it = iter(values)
+        for field, mn, mx, av, sd, zn in zip(fields, it, it, it, it, it):
             stats[field] = {
-                'min': self._to_float(row[idx]),
-                'max': self._to_float(row[idx + 1]),
-                'avg': self._to_float(row[idx + 2]),
-                'stddev': self._to_float(row[idx + 3]),
-                'total_count': row[idx + 4],
-                'zero_or_null_count': row[idx + 5],
-                'zero_or_null_ratio': round(row[idx + 5] / total, 4) if total else 0,
+                'min': to_float(mn),
+                'max': to_float(mx),
+                'avg': to_float(av),
+                'stddev': to_float(sd),
+                'total_count': row_count,
+                'zero_or_null_count': zn,
+                'zero_or_null_ratio': round(zn / total, 4),
             }
-            idx += 6
-
         return stats
 
+    def _get_categorical_stats_query(self, table: str, loan_type: str,
+                                     fields: list) -> dict:
+        client = get_clickhouse_client(database=self.ch_database)
+        return self._get_categorical_stats(client, table, loan_type, fields)
+
     def _get_categorical_stats(self, client, table: str, loan_type: str,
                                fields: list) -> dict:
+        """
+        Value frequencies for every categorical field in one scan.
+
+        ARRAY JOIN fans each row out into one (field index, value) pair per
+        field, so a single GROUP BY covers all fields instead of one query
+        and one table scan per field.
+        """
         stats = {}
-        for field in fields:
-            # Get all values (no limit)
-            query = (
-                f"SELECT toString({field}) AS value, count() AS frequency "
-                f"FROM {table} "
-                f"WHERE loan_type = {{loan_type:String}} "
-                f"GROUP BY value "
-                f"ORDER BY frequency DESC"
+        if not fields:
+            return stats
+
+        pairs = ', '.join(
+            f"({i}, toString({field}))" for i, field in enumerate(fields)
+        )
+        # Get all values (no limit)
+        query = (
+            f"SELECT kv.1 AS field_idx, kv.2 AS value, count() AS frequency "
+            f"FROM {table} "
+            f"ARRAY JOIN [{pairs}] AS kv "
+            f"WHERE loan_type = {{loan_type:String}} "
+            f"GROUP BY field_idx, value "
+            f"ORDER BY field_idx, frequency DESC"
+        )
+        result = client.query(query, parameters={'loan_type': loan_type})
+
+        values_by_field = [[] for _ in fields]
+        for field_idx, value, frequency in result.result_rows:
+            values_by_field[field_idx].append(
+                {'value': value if value else None, 'frequency': frequency}
             )
-            result = client.query(query, parameters={'loan_type': loan_type})
-            values = [
-                {'value': row[0] if row[0] else None, 'frequency': row[1]}
-                for row in result.result_rows
-            ]
+
+        for field, values in zip(fields, values_by_field):
             # Skip fields where all values are NULL
             non_null = [v for v in values if v['value'] is not None]
             if non_null:
@@ -205,92 +293,52 @@ class ProfilingEngine:
                 }
         return stats
 
-    def _get_null_ratios(self, client, table: str, loan_type: str,
-                         fields: list) -> dict:
-        if not fields:
-            return {}
-
-        select_parts = ["count()"]
-        for field in fields:
-            select_parts.append(f"countIf(isNull({field})) / count()")
-
-        query = (
-            f"SELECT {', '.join(select_parts)} "
-            f"FROM {table} "
-            f"WHERE loan_type = {{loan_type:String}}"
-        )
-        result = client.query(query, parameters={'loan_type': loan_type})
-        if not result.result_rows:
-            return {}
-
-        row = result.result_rows[0]
-        ratios = {}
-        for i, field in enumerate(fields):
-            ratios[field] = round(self._to_float(row[i + 1]), 4)
-        return ratios
-
-    def _get_completeness(self, client, table: str, loan_type: str,
-                          data_type: str, numeric_fields: list) -> dict:
-        """Get missing data ratio for non-numeric fields, filtered by loan type."""
-        # Get all columns from the table
-        col_result = client.query(
-            "SELECT name, type FROM system.columns "
-            "WHERE database = currentDatabase() AND table = {table:String} "
-            "ORDER BY position",
-            parameters={'table': table},
+    def _get_table_columns(self, client, table: str) -> list:
+        """All (name, type) columns of the table, in position order."""
+        # Cached — schema rarely changes; shares the frontend data view's
+        # entry for the same table
+        return cache_get_or_set(
+            ch_schema_key(self._tenant_id, table),
+            lambda: [
+                (r[0], r[1]) for r in client.query(
+                    "SELECT name, type FROM system.columns "
+                    "WHERE database = currentDatabase() AND table = {table:String} "
+                    "ORDER BY position",
+                    parameters={'table': table},
+                ).result_rows
+            ],
+            TTL_CH_SCHEMA,
         )
-        if not col_result.result_rows:
-            return {}
 
+    def _get_completeness_columns(self, col_data: list, loan_type: str,
+                                  data_type: str, numeric_fields: list) -> list:
+        """Non-numeric (name, type) columns checked for missing data, filtered by loan type."""
         # Determine which fields to exclude (loan-type specific)
-        exclude = set(self.META_FIELDS) | set(numeric_fields)
-        if data_type == 'credit':
-            if loan_type == 'RETAIL':
-                exclude |= self.COMMERCIAL_ONLY_FIELDS
-            else:
-                exclude |= self.RETAIL_ONLY_FIELDS
-
-        columns = []
-        for name, col_type in col_result.result_rows:
-            if name in exclude:
-                continue
-            columns.append((name, col_type))
-
-        if not columns:
-            return {}
+        if data_type != 'credit':
+            exclude = self.META_FIELDS
+        elif loan_type == 'RETAIL':
+            exclude = self._EXCLUDE_CREDIT_RETAIL
+        else:
+            exclude = self._EXCLUDE_CREDIT_COMMERCIAL
+        exclude = exclude.union(numeric_fields)
 
-        # Build query: for each column check null/empty based on type
-        select_parts = ["count()"]
-        for name, col_type in columns:
-            if 'Nullable' in col_type:
-                select_parts.append(f"countIf(isNull({name}))")
-            elif 'String' in col_type:
-                select_parts.append(f"countIf({name} = '')")
-            else:
-                # Non-nullable numeric: always filled, missing = 0
-                select_parts.append("0")
+        return [
+            (name, col_type) for name, col_type in col_data
+            if name not in exclude
+        ]
 
-        query = (
-            f"SELECT {', '.join(select_parts)} "
-            f"FROM {table} "
-            f"WHERE loan_type = {{loan_type:String}}"
-        )
-        result = client.query(query, parameters={'loan_type': loan_type})
-        if not result.result_rows:
-            return {}
-
-        row = result.result_rows[0]
-        total = row[0] if row[0] else 1
-        completeness = {}
-        for i, (name, col_type) in enumerate(columns):
-            missing = row[i + 1]
-            completeness[name] = {
+    @staticmethod
+    def _build_completeness(row_count: int, missing_counts, columns: list) -> dict:
+        total = row_count if row_count else 1
+        return {
+            name: {
                 'missing_count': missing,
-                'missing_pct': round((missing / total) * 100, 2) if total else 0,
-                'filled_pct': round(((total - missing) / total) * 100, 2) if total else 0,
+                'missing_pct': round((missing / total) * 100, 2),
+                'filled_pct': round(((total - missing) / total) * 100, 2),
                 'total': total,
             }
-        return completeness
+            for missing, (name, _col_type) in zip(missing_counts, columns)
+        }
 
     @staticmethod
     def _to_float(value):
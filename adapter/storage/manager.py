@@ -2,21 +2,191 @@
 ClickHouse Storage Manager - Handles atomic data replacement using REPLACE PARTITION.
 
 Flow:
-1. TRUNCATE staging tables
+1. Clear the loan_type partition of the staging tables
 2. INSERT normalized data into staging tables
 3. If validation passed: ALTER TABLE REPLACE PARTITION from staging to fact
-4. TRUNCATE staging tables
-5. If validation failed: TRUNCATE staging (fact tables untouched)
+4. Clear the staging partition
+5. If validation failed: clear the staging partition (fact tables untouched)
+
+Staging is partitioned by loan_type like the fact tables, so clearing only
+the load's own partition lets RETAIL and COMMERCIAL syncs of one tenant
+run concurrently without wiping each other's staged rows.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
 
 from adapter.clickhouse_manager import get_clickhouse_client
 from adapter.metrics import clickhouse_rows_inserted_total
 
 logger = logging.getLogger(__name__)
 
+# Partition values of the fact/staging tables (SyncConfiguration.LOAN_TYPE_CHOICES)
+LOAN_TYPES = frozenset(('RETAIL', 'COMMERCIAL'))
+
+_ZERO = Decimal('0')
+_NULL_STRINGS = frozenset(('', 'None'))
+
+
+def _to_uint(value) -> int:
+    # Normalized counts are usually int already; skip int() and max().
+    if type(value) is int:
+        return value if value > 0 else 0
+    if value is None:
+        return 0
+    try:
+        return max(0, int(value))
+    except (ValueError, TypeError):
+        return 0
+
+
+def _to_decimal(value) -> Decimal:
+    # Exact-type fast paths: normalized rates are already Decimal and
+    # CSV amounts are str, so most cells skip the str() round trip.
+    value_type = type(value)
+    if value_type is Decimal:
+        return value
+    if value_type is str:
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            return _ZERO
+    if value_type is int:
+        return Decimal(value)
+    if value is None:
+        return _ZERO
+    try:
+        return Decimal(str(value))
+    except Exception:
+        return _ZERO
+
+
+def _to_nullable_uint(value):
+    if type(value) is int:
+        return value
+    if value is None:
+        return None
+    if type(value) is str and value in _NULL_STRINGS:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_nullable_decimal(value):
+    value_type = type(value)
+    if value_type is Decimal:
+        return value
+    if value is None:
+        return None
+    if value_type is str:
+        if value in _NULL_STRINGS:
+            return None
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            return None
+    if value_type is int:
+        return Decimal(value)
+    try:
+        return Decimal(str(value))
+    except Exception:
+        return None
+
+
+def _partition_literal(loan_type: str) -> str:
+    """Quote a loan_type for a PARTITION clause, rejecting unknown values."""
+    if loan_type not in LOAN_TYPES:
+        raise ValueError(f"Unknown loan_type: {loan_type!r}")
+    return f"'{loan_type}'"
+
+
+def _or_none(value):
+    return value or None
+
+
+# Per-field (record key, default, converter) for every column after the
+# batch_id/loan_type/loaded_at prefix, in _CREDIT_COLUMNS order. A
+# converter of None passes the value through (dates are already date/None).
+_CREDIT_FIELDS = (
+    ('loan_account_number', '', str),
+    ('customer_id', '', str),
+    ('customer_type', '', str),
+    ('loan_status_code', '', str),
+    ('days_past_due', 0, _to_uint),
+    ('final_maturity_date', None, None),
+    ('total_installment_count', 0, _to_uint),
+    ('outstanding_installment_count', 0, _to_uint),
+    ('paid_installment_count', 0, _to_uint),
+    ('first_payment_date', None, None),
+    ('original_loan_amount', 0, _to_decimal),
+    ('outstanding_principal_balance', 0, _to_decimal),
+    ('nominal_interest_rate', 0, _to_decimal),
+    ('total_interest_amount', 0, _to_decimal),
+    ('kkdf_rate', 0, _to_decimal),
+    ('kkdf_amount', 0, _to_decimal),
+    ('bsmv_rate', 0, _to_decimal),
+    ('bsmv_amount', 0, _to_decimal),
+    ('grace_period_months', 0, _to_uint),
+    ('installment_frequency', 1, _to_uint),
+    ('loan_start_date', None, None),
+    ('loan_closing_date', None, None),
+    ('internal_rating', None, _to_nullable_uint),
+    ('external_rating', None, _to_nullable_uint),
+    # Commercial-only
+    ('loan_product_type', None, _to_nullable_uint),
+    ('customer_region_code', None, _or_none),
+    ('sector_code', None, _to_nullable_uint),
+    ('internal_credit_rating', None, _to_nullable_uint),
+    ('default_probability', None, _to_nullable_decimal),
+    ('risk_class', None, _to_nullable_uint),
+    ('customer_segment', None, _to_nullable_uint),
+    # Retail-only
+    ('insurance_included', None, _to_nullable_uint),
+    ('customer_district_code', None, _or_none),
+    ('customer_province_code', None, _or_none),
+)
+
+_PAYMENT_FIELDS = (
+    ('loan_account_number', '', str),
+    ('installment_number', 0, _to_uint),
+    ('actual_payment_date', None, None),
+    ('scheduled_payment_date', None, None),
+    ('installment_amount', 0, _to_decimal),
+    ('principal_component', 0, _to_decimal),
+    ('interest_component', 0, _to_decimal),
+    ('kkdf_component', 0, _to_decimal),
+    ('bsmv_component', 0, _to_decimal),
+    ('installment_status', '', str),
+    ('remaining_principal', 0, _to_decimal),
+    ('remaining_interest', 0, _to_decimal),
+    ('remaining_kkdf', 0, _to_decimal),
+    ('remaining_bsmv', 0, _to_decimal),
+)
+
+
+def _build_columns(records: list, fields: tuple, loan_type: str,
+                   batch_id: str, now: datetime) -> list:
+    """
+    Build one list per insert column (column-oriented) for records.
+
+    Each column is a single comprehension over the batch, so there is no
+    per-row tuple and the driver does not have to transpose rows back
+    into columns before serializing its native blocks.
+    """
+    n = len(records)
+    columns = [[batch_id] * n, [loan_type] * n, [now] * n]
+    for key, default, convert in fields:
+        if convert is None:
+            columns.append([r.get(key, default) for r in records])
+        else:
+            columns.append([convert(r.get(key, default)) for r in records])
+    return columns
+
 
 class StorageManager:
     """Manages atomic data loading into ClickHouse using REPLACE PARTITION."""
@@ -24,45 +194,92 @@ class StorageManager:
     def __init__(self, ch_database: str):
         self.ch_database = ch_database
         self._tenant_id = ch_database.replace('_dw', '').upper()
+        # Labelled counter children bound once instead of per store call
+        self._credit_rows_counter = clickhouse_rows_inserted_total.labels(
+            tenant=self._tenant_id, table='fact_credit',
+        )
+        self._payment_rows_counter = clickhouse_rows_inserted_total.labels(
+            tenant=self._tenant_id, table='fact_payment',
+        )
 
     def _get_client(self):
         return get_clickhouse_client(database=self.ch_database)
 
-    INSERT_BATCH_SIZE = 50_000  # rows per ClickHouse insert batch
+    INSERT_BATCH_SIZE = settings.CLICKHOUSE_INSERT_BATCH_SIZE  # rows per ClickHouse insert batch
+    # Keep each batch as one server-side block instead of re-splitting it
+    _INSERT_SETTINGS = {
+        'max_insert_block_size': INSERT_BATCH_SIZE,
+        'min_insert_block_size_rows': INSERT_BATCH_SIZE,
+    }
+
+    # Insert column order; matches _CREDIT_FIELDS / _PAYMENT_FIELDS after
+    # the batch_id/loan_type/loaded_at prefix
+    _CREDIT_COLUMNS = (
+        'batch_id', 'loan_type', 'loaded_at',
+        'loan_account_number', 'customer_id', 'customer_type',
+        'loan_status_code', 'days_past_due', 'final_maturity_date',
+        'total_installment_count', 'outstanding_installment_count',
+        'paid_installment_count', 'first_payment_date',
+        'original_loan_amount', 'outstanding_principal_balance',
+        'nominal_interest_rate', 'total_interest_amount',
+        'kkdf_rate', 'kkdf_amount', 'bsmv_rate', 'bsmv_amount',
+        'grace_period_months', 'installment_frequency',
+        'loan_start_date', 'loan_closing_date',
+        'internal_rating', 'external_rating',
+        'loan_product_type',
+        'customer_region_code', 'sector_code',
+        'internal_credit_rating', 'default_probability',
+        'risk_class', 'customer_segment',
+        'insurance_included', 'customer_district_code',
+        'customer_province_code',
+    )
+
+    _PAYMENT_COLUMNS = (
+        'batch_id', 'loan_type', 'loaded_at',
+        'loan_account_number', 'installment_number',
+        'actual_payment_date', 'scheduled_payment_date',
+        'installment_amount', 'principal_component',
+        'interest_component', 'kkdf_component', 'bsmv_component',
+        'installment_status', 'remaining_principal',
+        'remaining_interest', 'remaining_kkdf', 'remaining_bsmv',
+    )
+
+    _STAGING_COLUMNS = {
+        'staging_credit': _CREDIT_COLUMNS,
+        'staging_payment': _PAYMENT_COLUMNS,
+    }
 
     def store_credits(self, records: list, loan_type: str, batch_id: str) -> int:
         """
         Store credit records atomically using batched inserts.
-        1. Truncate staging_credit
+        1. Clear the loan_type partition of staging_credit
         2. Insert into staging_credit in batches (memory efficient)
         3. REPLACE PARTITION from staging_credit to fact_credit
-        4. Truncate staging_credit
+        4. Clear the staging_credit partition
         """
         client = self._get_client()
         try:
-            client.command("TRUNCATE TABLE staging_credit")
+            self.clear_staging('staging_credit', loan_type)
 
             if not records:
                 return 0
 
-            columns = self._credit_columns()
-            total_inserted = 0
-
-            for i in range(0, len(records), self.INSERT_BATCH_SIZE):
-                batch = records[i:i + self.INSERT_BATCH_SIZE]
-                rows = [self._prepare_credit_row(r, loan_type, batch_id) for r in batch]
-                client.insert('staging_credit', rows, column_names=columns)
-                total_inserted += len(rows)
-
-            client.command(
-                f"ALTER TABLE fact_credit REPLACE PARTITION '{loan_type}' "
-                f"FROM staging_credit"
+            columns = self._CREDIT_COLUMNS
+            # One insert context per load: without it clickhouse-connect
+            # re-runs DESCRIBE TABLE on every insert() call.
+            context = client.create_insert_context(
+                'staging_credit', column_names=columns, column_oriented=True,
+                settings=self._INSERT_SETTINGS,
             )
-            client.command("TRUNCATE TABLE staging_credit")
+            now = datetime.utcnow()  # one loaded_at per load, not per row
+            total_inserted = self._insert_batches(
+                client, context, records, _CREDIT_FIELDS, loan_type, batch_id, now,
+            )
+
+            self.replace_partition('fact_credit', 'staging_credit', loan_type)
+            self.clear_staging('staging_credit', loan_type)
 
-            clickhouse_rows_inserted_total.labels(
-                tenant=self._tenant_id, table='fact_credit',
-            ).inc(total_inserted)
+            self._credit_rows_counter.inc(total_inserted)
             logger.info(
                 "Stored %d credit records for %s in %s",
                 total_inserted, loan_type, self.ch_database,
@@ -71,7 +288,7 @@ class StorageManager:
         except Exception as e:
             logger.error("Failed to store credits: %s", e)
             try:
-                client.command("TRUNCATE TABLE staging_credit")
+                self.clear_staging('staging_credit', loan_type)
             except Exception:
                 pass
             raise
@@ -83,29 +300,27 @@ class StorageManager:
         """
         client = self._get_client()
         try:
-            client.command("TRUNCATE TABLE staging_payment")
+            self.clear_staging('staging_payment', loan_type)
 
             if not records:
                 return 0
 
-            columns = self._payment_columns()
-            total_inserted = 0
-
-            for i in range(0, len(records), self.INSERT_BATCH_SIZE):
-                batch = records[i:i + self.INSERT_BATCH_SIZE]
-                rows = [self._prepare_payment_row(r, loan_type, batch_id) for r in batch]
-                client.insert('staging_payment', rows, column_names=columns)
-                total_inserted += len(rows)
-
-            client.command(
-                f"ALTER TABLE fact_payment REPLACE PARTITION '{loan_type}' "
-                f"FROM staging_payment"
+            columns = self._PAYMENT_COLUMNS
+            # One insert context per load: without it clickhouse-connect
+            # re-runs DESCRIBE TABLE on every insert() call.
+            context = client.create_insert_context(
+                'staging_payment', column_names=columns, column_oriented=True,
+                settings=self._INSERT_SETTINGS,
+            )
+            now = datetime.utcnow()  # one loaded_at per load, not per row
+            total_inserted = self._insert_batches(
+                client, context, records, _PAYMENT_FIELDS, loan_type, batch_id, now,
             )
-            client.command("TRUNCATE TABLE staging_payment")
 
-            clickhouse_rows_inserted_total.labels(
-                tenant=self._tenant_id, table='fact_payment',
-            ).inc(total_inserted)
+            self.replace_partition('fact_payment', 'staging_payment', loan_type)
+            self.clear_staging('staging_payment', loan_type)
+
+            self._payment_rows_counter.inc(total_inserted)
             logger.info(
                 "Stored %d payment records for %s in %s",
                 total_inserted, loan_type, self.ch_database,
@@ -114,137 +329,61 @@ class StorageManager:
         except Exception as e:
             logger.error("Failed to store payments: %s", e)
             try:
-                client.command("TRUNCATE TABLE staging_payment")
+                self.clear_staging('staging_payment', loan_type)
             except Exception:
                 pass
             raise
 
-    def _credit_columns(self):
-        return [
-            'batch_id', 'loan_type', 'loaded_at',
-            'loan_account_number', 'customer_id', 'customer_type',
-            'loan_status_code', 'days_past_due', 'final_maturity_date',
-            'total_installment_count', 'outstanding_installment_count',
-            'paid_installment_count', 'first_payment_date',
-            'original_loan_amount', 'outstanding_principal_balance',
-            'nominal_interest_rate', 'total_interest_amount',
-            'kkdf_rate', 'kkdf_amount', 'bsmv_rate', 'bsmv_amount',
-            'grace_period_months', 'installment_frequency',
-            'loan_start_date', 'loan_closing_date',
-            'internal_rating', 'external_rating',
-            'loan_product_type',
-            'customer_region_code', 'sector_code',
-            'internal_credit_rating', 'default_probability',
-            'risk_class', 'customer_segment',
-            'insurance_included', 'customer_district_code',
-            'customer_province_code',
-        ]
-
-    def _payment_columns(self):
-        return [
-            'batch_id', 'loan_type', 'loaded_at',
-            'loan_account_number', 'installment_number',
-            'actual_payment_date', 'scheduled_payment_date',
-            'installment_amount', 'principal_component',
-            'interest_component', 'kkdf_component', 'bsmv_component',
-            'installment_status', 'remaining_principal',
-            'remaining_interest', 'remaining_kkdf', 'remaining_bsmv',
-        ]
-
-    def _prepare_credit_row(self, record: dict, loan_type: str, batch_id: str) -> list:
-        now = datetime.utcnow()
-        return [
-            batch_id,
-            loan_type,
-            now,
-            str(record.get('loan_account_number', '')),
-            str(record.get('customer_id', '')),
-            str(record.get('customer_type', '')),
-            str(record.get('loan_status_code', '')),
-            self._to_uint(record.get('days_past_due', 0)),
-            record.get('final_maturity_date'),       # already date or None
-            self._to_uint(record.get('total_installment_count', 0)),
-            self._to_uint(record.get('outstanding_installment_count', 0)),
-            self._to_uint(record.get('paid_installment_count', 0)),
-            record.get('first_payment_date'),
-            self._to_decimal(record.get('original_loan_amount', 0)),
-            self._to_decimal(record.get('outstanding_principal_balance', 0)),
-            self._to_decimal(record.get('nominal_interest_rate', 0)),
-            self._to_decimal(record.get('total_interest_amount', 0)),
-            self._to_decimal(record.get('kkdf_rate', 0)),
-            self._to_decimal(record.get('kkdf_amount', 0)),
-            self._to_decimal(record.get('bsmv_rate', 0)),
-            self._to_decimal(record.get('bsmv_amount', 0)),
-            self._to_uint(record.get('grace_period_months', 0)),
-            self._to_uint(record.get('installment_frequency', 1)),
-            record.get('loan_start_date'),
-            record.get('loan_closing_date'),
-            self._to_nullable_uint(record.get('internal_rating')),
-            self._to_nullable_uint(record.get('external_rating')),
-            # Commercial-only
-            self._to_nullable_uint(record.get('loan_product_type')),
-            record.get('customer_region_code') or None,
-            self._to_nullable_uint(record.get('sector_code')),
-            self._to_nullable_uint(record.get('internal_credit_rating')),
-            self._to_nullable_decimal(record.get('default_probability')),
-            self._to_nullable_uint(record.get('risk_class')),
-            self._to_nullable_uint(record.get('customer_segment')),
-            # Retail-only
-            self._to_nullable_uint(record.get('insurance_included')),
-            record.get('customer_district_code') or None,
-            record.get('customer_province_code') or None,
-        ]
-
-    def _prepare_payment_row(self, record: dict, loan_type: str, batch_id: str) -> list:
-        now = datetime.utcnow()
-        return [
-            batch_id,
-            loan_type,
-            now,
-            str(record.get('loan_account_number', '')),
-            self._to_uint(record.get('installment_number', 0)),
-            record.get('actual_payment_date'),
-            record.get('scheduled_payment_date'),
-            self._to_decimal(record.get('installment_amount', 0)),
-            self._to_decimal(record.get('principal_component', 0)),
-            self._to_decimal(record.get('interest_component', 0)),
-            self._to_decimal(record.get('kkdf_component', 0)),
-            self._to_decimal(record.get('bsmv_component', 0)),
-            str(record.get('installment_status', '')),
-            self._to_decimal(record.get('remaining_principal', 0)),
-            self._to_decimal(record.get('remaining_interest', 0)),
-            self._to_decimal(record.get('remaining_kkdf', 0)),
-            self._to_decimal(record.get('remaining_bsmv', 0)),
-        ]
-
-    @staticmethod
-    def _to_uint(value) -> int:
-        try:
-            return max(0, int(value))
-        except (ValueError, TypeError):
-            return 0
+    def clear_staging(self, table: str, loan_type: str):
+        """Drop one loan_type partition of a staging table (no-op if empty)."""
+        self._get_client().command(
+            f"ALTER TABLE {table} DROP PARTITION {_partition_literal(loan_type)}"
+        )
 
-    @staticmethod
-    def _to_decimal(value) -> Decimal:
-        try:
-            return Decimal(str(value))
-        except Exception:
-            return Decimal('0')
+    def replace_partition(self, table: str, staging_table: str, loan_type: str):
+        """Atomically swap one loan_type partition of a fact table from staging."""
+        self._get_client().command(
+            f"ALTER TABLE {table} REPLACE PARTITION {_partition_literal(loan_type)} "
+            f"FROM {staging_table}"
+        )
 
-    @staticmethod
-    def _to_nullable_uint(value):
-        if value is None or value == '' or value == 'None':
-            return None
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return None
+    def staging_context(self, staging_table: str):
+        """
+        Insert context for a staging table, to be reused for every
+        insert_staging() call of one load so the schema is described once.
+        """
+        return self._get_client().create_insert_context(
+            staging_table, column_names=self._STAGING_COLUMNS[staging_table],
+            column_oriented=True, settings=self._INSERT_SETTINGS,
+        )
 
-    @staticmethod
-    def _to_nullable_decimal(value):
-        if value is None or value == '' or value == 'None':
-            return None
-        try:
-            return Decimal(str(value))
-        except Exception:
-            return None
+    def insert_staging(self, context, records: list, fields: tuple,
+                       loan_type: str, batch_id: str, now: datetime) -> int:
+        """
+        Insert one batch of normalized records into the staging table of
+        context. The caller is responsible for the partition swap.
+        """
+        return self._insert_batches(
+            self._get_client(), context, records, fields, loan_type, batch_id, now,
+        )
+
+    def _insert_batches(self, client, context, records: list, fields: tuple,
+                        loan_type: str, batch_id: str, now: datetime) -> int:
+        """
+        Insert records in INSERT_BATCH_SIZE slices, building batch N+1
+        while batch N is being sent. Only one insert is in flight at a
+        time, so the client and insert context are never used concurrently.
+        """
+        pending = None
+        with ThreadPoolExecutor(max_workers=1) as insert_pool:
+            for i in range(0, len(records), self.INSERT_BATCH_SIZE):
+                data = _build_columns(
+                    records[i:i + self.INSERT_BATCH_SIZE],
+                    fields, loan_type, batch_id, now,
+                )
+                if pending is not None:
+                    pending.result()
+                pending = insert_pool.submit(client.insert, data=data, context=context)
+            if pending is not None:
+                pending.result()
+        return len(records)
@@ -5,19 +5,28 @@ Pipeline: FETCH -> VALIDATE -> NORMALIZE -> STORE -> LOG
 
 Memory-efficient chunked processing:
   - Data is fetched from Redis in chunks (50k rows)
-  - Each chunk is validated, normalized, and inserted into ClickHouse staging
+  - Each chunk is validated and normalized; valid rows are coalesced and
+    inserted into ClickHouse staging in whole INSERT_BATCH_SIZE slices, the
+    remainder waiting for the next chunk
   - Only after all chunks are processed, partition is atomically replaced
-  - Memory usage is bounded by chunk size, not total dataset size
+  - Peak memory does not grow with the dataset: up to INSERT_BATCH_SIZE + one
+    chunk of normalized row dicts (~250k with the defaults) held while
+    pending, plus two INSERT_BATCH_SIZE column sets (200k rows each), one
+    being built while the previous one is in flight
 
 If error_rate > 50%, abort and preserve old data.
 """
+import io
 import logging
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import timezone, datetime
 
 import redis as _redis
 from django.conf import settings
+from django.db import connection
 
 from adapter.models import SyncLog, SyncConfiguration, ValidationError as VE
 from core.cache import invalidate_after_sync
@@ -29,17 +38,92 @@ from adapter.metrics import (
 from adapter.validators.field_validators import CreditFieldValidator, PaymentFieldValidator
 from adapter.validators.cross_validators import CrossFileValidator
 from adapter.validators.base import BatchValidationResult
-from adapter.normalizers.date_normalizer import DateNormalizer
-from adapter.normalizers.rate_normalizer import RateNormalizer
+from adapter.normalizers.date_normalizer import DateNormalizer, normalize_date
+from adapter.normalizers.rate_normalizer import RateNormalizer, normalize_rate
 from adapter.normalizers.category_normalizer import CategoryNormalizer
-from adapter.storage.manager import StorageManager
+from adapter.storage.manager import StorageManager, _CREDIT_FIELDS, _PAYMENT_FIELDS
 from adapter.sync.fetcher import DataFetcher
 
 logger = logging.getLogger(__name__)
 
+# Runs ClickHouse lookups that the sync needs later (existing loan IDs)
+# alongside the credit phase. Worker threads get their own cached client.
+_prefetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='sync-prefetch')
+
+# Shared by every SyncEngine in the process so the lock round trips reuse
+# open sockets instead of connecting on each sync.
+_redis_pool = _redis.ConnectionPool(
+    host=getattr(settings, 'REDIS_HOST', 'redis'),
+    port=6379, db=0,
+)
+
 MAX_ERROR_RATE = 0.50  # Abort if more than 50% of rows have errors
-ERROR_SAVE_BATCH = 1000
+ERROR_SAVE_BATCH = 50_000  # Rows per COPY into validation_errors
+ERROR_FLUSH_ROWS = 10_000  # Buffered errors that trigger a COPY mid-sync
+MAX_SAVED_ERRORS = 50_000  # Errors persisted per file type and sync
 SYNC_LOCK_TTL = 600  # 10 minutes
+SYNC_LOCK_WAKE_TTL = 60  # Seconds an unclaimed wake-up token survives
+SYNC_LOCK_MAX_BLOCK = 30  # Max BLPOP wait before re-checking the lock
+
+# Release the sync lock only if this sync still owns it (it may have
+# expired and been taken by another worker), then wake one waiter.
+_RELEASE_LOCK_LUA = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    redis.call('del', KEYS[1])
+    redis.call('rpush', KEYS[2], '1')
+    redis.call('expire', KEYS[2], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# SyncLog columns written when a sync finishes (COMPLETED or aborted)
+_SYNC_RESULT_FIELDS = [
+    'status', 'valid_credit_rows', 'valid_payment_rows',
+    'error_count', 'error_summary', 'completed_at',
+]
+
+
+@dataclass
+class _PhaseState:
+    """Counters and buffers for one sync phase (credit or payment_plan)."""
+    file_type: str
+    fields: tuple
+    loaded_at: datetime
+    context: object
+    row_idx: int = 0
+    valid_count: int = 0
+    error_count: int = 0
+    error_summary: dict = field(default_factory=dict)
+    errors: list = field(default_factory=list)  # Not yet COPYed to Postgres
+    errors_kept: int = 0
+    pending: list = field(default_factory=list)  # Normalized, not yet inserted
+
+    def add_invalid_row(self, errors):
+        self.error_count += 1
+        summary = self.error_summary
+        for err in errors:
+            err_type = err.get('error_type', 'UNKNOWN')
+            summary[err_type] = summary.get(err_type, 0) + 1
+            if self.errors_kept < MAX_SAVED_ERRORS:
+                self.errors_kept += 1
+                self.errors.append(err)
+
+    def add_cross_reference_error(self, row_number, loan_id):
+        # Counted always, but the error dict and message are only built
+        # while there is room left under MAX_SAVED_ERRORS.
+        self.error_count += 1
+        summary = self.error_summary
+        summary['CROSS_REFERENCE'] = summary.get('CROSS_REFERENCE', 0) + 1
+        if self.errors_kept < MAX_SAVED_ERRORS:
+            self.errors_kept += 1
+            self.errors.append({
+                'row_number': row_number,
+                'field_name': 'loan_account_number',
+                'error_type': 'CROSS_REFERENCE',
+                'error_message': f'loan_account_number {loan_id} not found in credit records',
+                'raw_value': loan_id,
+            })
 
 
 class SyncEngine:
@@ -64,10 +148,7 @@ class SyncEngine:
         self.storage_manager = StorageManager(ch_database)
 
     def _get_redis(self):
-        return _redis.Redis(
-            host=getattr(settings, 'REDIS_HOST', 'redis'),
-            port=6379, db=0,
-        )
+        return _redis.Redis(connection_pool=_redis_pool)
 
     def sync(self, loan_type: str, wait_for_lock: bool = False) -> SyncLog:
         """
@@ -82,6 +163,7 @@ class SyncEngine:
         # Acquire distributed lock
         r = self._get_redis()
         lock_key = f"sync_lock:{self.tenant_id}:{loan_type}"
+        wake_key = f"sync_lock_wake:{self.tenant_id}:{loan_type}"
         acquired = r.set(lock_key, self.batch_id, nx=True, ex=SYNC_LOCK_TTL)
 
         if not acquired and wait_for_lock:
@@ -89,14 +171,18 @@ class SyncEngine:
                 "Sync lock held for %s/%s, waiting for release...",
                 self.tenant_id, loan_type,
             )
-            waited = 0
-            while not acquired and waited < SYNC_LOCK_TTL:
-                time.sleep(2)
-                waited += 2
+            wait_start = time.monotonic()
+            while not acquired:
+                remaining = SYNC_LOCK_TTL - (time.monotonic() - wait_start)
+                if remaining <= 0:
+                    break
+                # The holder pushes a token on release. The bounded timeout
+                # also covers holders that died and let the lock expire.
+                r.blpop(wake_key, timeout=max(1, int(min(remaining, SYNC_LOCK_MAX_BLOCK))))
                 acquired = r.set(lock_key, self.batch_id, nx=True, ex=SYNC_LOCK_TTL)
             if acquired:
                 logger.info("Lock acquired after %ds wait for %s/%s",
-                            waited, self.tenant_id, loan_type)
+                            time.monotonic() - wait_start, self.tenant_id, loan_type)
 
         if not acquired:
             logger.warning(
@@ -113,12 +199,13 @@ class SyncEngine:
             sync_log.save()
             return sync_log
 
+        # Not written until the row counts are known, so the log is
+        # created with a single INSERT.
         sync_log = SyncLog(
             loan_type=loan_type,
             batch_id=self.batch_id,
-            status='STARTED',
+            status='FETCHING',
         )
-        sync_log.save()
         start_time = time.time()
 
         try:
@@ -135,131 +222,61 @@ class SyncEngine:
             )
 
             # ── Phase 1: CREDITS (validate → normalize → staging) ──
-            self._update_status(sync_log, 'FETCHING')
-            client = self.storage_manager._get_client()
-            client.command("TRUNCATE TABLE staging_credit")
+            self.storage_manager.clear_staging('staging_credit', loan_type)
+            # fact_credit is not touched until the partition swap, so the
+            # existing loan IDs can be fetched while credits are processed.
+            existing_loans_future = _prefetch_pool.submit(
+                self.cross_validator._get_existing_loans, self.ch_database, loan_type,
+            )
+            # One loaded_at for the whole batch, credits and payments alike
+            loaded_at = datetime.utcnow()
 
-            valid_credit_count = 0
-            credit_error_count = 0
-            credit_error_summary = {}
+            # Reused across chunks so the staging schema is described only once
+            credit_context = self.storage_manager.staging_context('staging_credit')
+
+            credits = _PhaseState('credit', _CREDIT_FIELDS, loaded_at, credit_context)
             valid_loan_ids = set()  # Only store IDs, not full records
-            all_credit_errors = []
-            global_row_idx = 0
 
+            # Chunks are validated, normalized and staged together, so the
+            # status is written once per phase rather than once per chunk.
             self._update_status(sync_log, 'VALIDATING')
 
-            for chunk in self.fetcher.fetch_iter(loan_type, 'credit'):
-                # Validate chunk
-                chunk_valid = []
-                for row in chunk:
-                    global_row_idx += 1
-                    vr = self.credit_validator.validate_row(row, global_row_idx, loan_type)
-                    if vr.is_valid:
-                        chunk_valid.append(row)
-                        loan_id = row.get('loan_account_number', '')
-                        if loan_id:
-                            valid_loan_ids.add(loan_id)
-                    else:
-                        credit_error_count += 1
-                        for err in vr.errors:
-                            err_type = err.get('error_type', 'UNKNOWN')
-                            credit_error_summary[err_type] = credit_error_summary.get(err_type, 0) + 1
-                            if len(all_credit_errors) < 50000:
-                                all_credit_errors.append(err)
-
-                # Normalize and insert valid records into staging
-                if chunk_valid:
-                    self._update_status(sync_log, 'NORMALIZING')
-                    normalized = []
-                    for record in chunk_valid:
-                        record = self.date_normalizer.normalize_credit(record)
-                        record = self.rate_normalizer.normalize_credit(record, loan_type)
-                        record = self.category_normalizer.normalize_credit(record, loan_type)
-                        normalized.append(record)
-
-                    self._update_status(sync_log, 'STORING')
-                    columns = self.storage_manager._credit_columns()
-                    rows = [
-                        self.storage_manager._prepare_credit_row(r, loan_type, self.batch_id)
-                        for r in normalized
-                    ]
-                    client.insert('staging_credit', rows, column_names=columns)
-                    valid_credit_count += len(rows)
-                    del normalized, rows  # Free memory
-
-                del chunk, chunk_valid  # Free memory
+            self._run_phase(
+                sync_log, loan_type, credits,
+                lambda chunk: self._validate_credit_chunk(chunk, loan_type, credits, valid_loan_ids),
+                lambda rows: self._normalize_credits(rows, loan_type),
+            )
 
+            valid_credit_count = credits.valid_count
+            credit_error_count = credits.error_count
+            credit_error_summary = credits.error_summary
             logger.info(
                 "Credits processed: %d valid, %d errors out of %d total",
                 valid_credit_count, credit_error_count, total_credits,
             )
 
             # ── Phase 2: PAYMENTS (validate → cross-validate → normalize → staging) ──
-            client.command("TRUNCATE TABLE staging_payment")
+            self.storage_manager.clear_staging('staging_payment', loan_type)
 
             # Also get existing ClickHouse loan IDs for cross-validation
-            existing_loan_ids = self.cross_validator._get_existing_loans(
-                self.ch_database, loan_type
+            existing_loan_ids = existing_loans_future.result()
+            # Merge in place: a `|` union would hold a third copy of every ID
+            valid_loan_ids.update(existing_loan_ids)
+            all_valid_loans = valid_loan_ids
+            del existing_loan_ids
+
+            payment_context = self.storage_manager.staging_context('staging_payment')
+            payments = _PhaseState('payment_plan', _PAYMENT_FIELDS, loaded_at, payment_context)
+
+            self._run_phase(
+                sync_log, loan_type, payments,
+                lambda chunk: self._validate_payment_chunk(chunk, loan_type, payments, all_valid_loans),
+                self._normalize_payments,
             )
-            all_valid_loans = valid_loan_ids | existing_loan_ids
-
-            valid_payment_count = 0
-            payment_error_count = 0
-            payment_error_summary = {}
-            all_payment_errors = []
-            global_row_idx = 0
-
-            for chunk in self.fetcher.fetch_iter(loan_type, 'payment_plan'):
-                chunk_valid = []
-                for row in chunk:
-                    global_row_idx += 1
-                    # Field validation
-                    vr = self.payment_validator.validate_row(row, global_row_idx, loan_type)
-                    if not vr.is_valid:
-                        payment_error_count += 1
-                        for err in vr.errors:
-                            err_type = err.get('error_type', 'UNKNOWN')
-                            payment_error_summary[err_type] = payment_error_summary.get(err_type, 0) + 1
-                            if len(all_payment_errors) < 50000:
-                                all_payment_errors.append(err)
-                        continue
-
-                    # Cross-validation: check loan_account_number exists
-                    loan_id = row.get('loan_account_number', '')
-                    if loan_id not in all_valid_loans:
-                        payment_error_count += 1
-                        err = {
-                            'row_number': global_row_idx,
-                            'field_name': 'loan_account_number',
-                            'error_type': 'CROSS_REFERENCE',
-                            'error_message': f'loan_account_number {loan_id} not found in credit records',
-                            'raw_value': loan_id,
-                        }
-                        payment_error_summary['CROSS_REFERENCE'] = payment_error_summary.get('CROSS_REFERENCE', 0) + 1
-                        if len(all_payment_errors) < 50000:
-                            all_payment_errors.append(err)
-                        continue
-
-                    chunk_valid.append(row)
-
-                # Normalize and insert valid payments into staging
-                if chunk_valid:
-                    normalized = []
-                    for record in chunk_valid:
-                        record = self.date_normalizer.normalize_payment(record)
-                        record = self.category_normalizer.normalize_payment(record)
-                        normalized.append(record)
-
-                    columns = self.storage_manager._payment_columns()
-                    rows = [
-                        self.storage_manager._prepare_payment_row(r, loan_type, self.batch_id)
-                        for r in normalized
-                    ]
-                    client.insert('staging_payment', rows, column_names=columns)
-                    valid_payment_count += len(rows)
-                    del normalized, rows
-
-                del chunk, chunk_valid
+
+            valid_payment_count = payments.valid_count
+            payment_error_count = payments.error_count
+            payment_error_summary = payments.error_summary
 
             logger.info(
                 "Payments processed: %d valid, %d errors out of %d total",
@@ -269,11 +286,13 @@ class SyncEngine:
             # ── Phase 3: Check error rate ──
             total_rows = total_credits + total_payments
             total_errors = credit_error_count + payment_error_count
+            invalid_rows = total_rows - valid_credit_count - valid_payment_count
+            error_rate = invalid_rows / total_rows if total_rows else 0.0
 
-            if total_rows > 0 and (total_rows - valid_credit_count - valid_payment_count) / total_rows > MAX_ERROR_RATE:
+            if error_rate > MAX_ERROR_RATE:
                 # Abort — clean staging, preserve fact tables
-                client.command("TRUNCATE TABLE staging_credit")
-                client.command("TRUNCATE TABLE staging_payment")
+                self.storage_manager.clear_staging('staging_credit', loan_type)
+                self.storage_manager.clear_staging('staging_payment', loan_type)
 
                 sync_log.status = 'FAILED'
                 sync_log.valid_credit_rows = valid_credit_count
@@ -285,10 +304,7 @@ class SyncEngine:
                     **payment_error_summary,
                 }
                 sync_log.completed_at = datetime.now(timezone.utc)
-                sync_log.save()
-
-                self._save_errors_batched(sync_log, all_credit_errors, 'credit')
-                self._save_errors_batched(sync_log, all_payment_errors, 'payment_plan')
+                sync_log.save(update_fields=_SYNC_RESULT_FIELDS)
                 self._update_sync_config(loan_type, 'FAILED')
                 self._cleanup_redis(loan_type)
 
@@ -299,7 +315,7 @@ class SyncEngine:
                 logger.warning(
                     "Sync aborted for %s/%s: error rate %.1f%%",
                     self.tenant_id, loan_type,
-                    (total_rows - valid_credit_count - valid_payment_count) / total_rows * 100,
+                    error_rate * 100,
                 )
                 return sync_log
 
@@ -307,18 +323,16 @@ class SyncEngine:
             self._update_status(sync_log, 'STORING')
 
             if valid_credit_count > 0:
-                client.command(
-                    f"ALTER TABLE fact_credit REPLACE PARTITION '{loan_type}' "
-                    f"FROM staging_credit"
+                self.storage_manager.replace_partition(
+                    'fact_credit', 'staging_credit', loan_type,
                 )
-            client.command("TRUNCATE TABLE staging_credit")
+            self.storage_manager.clear_staging('staging_credit', loan_type)
 
             if valid_payment_count > 0:
-                client.command(
-                    f"ALTER TABLE fact_payment REPLACE PARTITION '{loan_type}' "
-                    f"FROM staging_payment"
+                self.storage_manager.replace_partition(
+                    'fact_payment', 'staging_payment', loan_type,
                 )
-            client.command("TRUNCATE TABLE staging_payment")
+            self.storage_manager.clear_staging('staging_payment', loan_type)
 
             from adapter.metrics import clickhouse_rows_inserted_total
             clickhouse_rows_inserted_total.labels(
@@ -335,10 +349,7 @@ class SyncEngine:
             sync_log.error_count = total_errors
             sync_log.error_summary = {**credit_error_summary, **payment_error_summary}
             sync_log.completed_at = datetime.now(timezone.utc)
-            sync_log.save()
-
-            self._save_errors_batched(sync_log, all_credit_errors, 'credit')
-            self._save_errors_batched(sync_log, all_payment_errors, 'payment_plan')
+            sync_log.save(update_fields=_SYNC_RESULT_FIELDS)
 
             sync_operations_total.labels(
                 tenant=self.tenant_id, loan_type=loan_type, status='COMPLETED',
@@ -347,10 +358,11 @@ class SyncEngine:
                 tenant=self.tenant_id, loan_type=loan_type,
             ).observe(time.time() - start_time)
 
-            for err in all_credit_errors + all_payment_errors:
-                validation_errors_total.labels(
-                    tenant=self.tenant_id, error_type=err.get('error_type', 'UNKNOWN'),
-                ).inc()
+            for summary in (credit_error_summary, payment_error_summary):
+                for err_type, count in summary.items():
+                    validation_errors_total.labels(
+                        tenant=self.tenant_id, error_type=err_type,
+                    ).inc(count)
 
             self._update_sync_config(loan_type, 'COMPLETED')
             self._cleanup_redis(loan_type)
@@ -368,16 +380,19 @@ class SyncEngine:
         except Exception as e:
             # Clean up staging on failure
             try:
-                client = self.storage_manager._get_client()
-                client.command("TRUNCATE TABLE staging_credit")
-                client.command("TRUNCATE TABLE staging_payment")
+                self.storage_manager.clear_staging('staging_credit', loan_type)
+                self.storage_manager.clear_staging('staging_payment', loan_type)
             except Exception:
                 pass
 
             sync_log.status = 'FAILED'
             sync_log.error_summary = {'exception': str(e)}
             sync_log.completed_at = datetime.now(timezone.utc)
-            sync_log.save()
+            if sync_log._state.adding:
+                # Failed before the log was first written
+                sync_log.save()
+            else:
+                sync_log.save(update_fields=['status', 'error_summary', 'completed_at'])
             self._update_sync_config(loan_type, 'FAILED')
             sync_operations_total.labels(
                 tenant=self.tenant_id, loan_type=loan_type, status='FAILED',
@@ -391,47 +406,188 @@ class SyncEngine:
         finally:
             # Always release the distributed lock
             try:
-                r.delete(lock_key)
+                r.eval(_RELEASE_LOCK_LUA, 2, lock_key, wake_key,
+                       self.batch_id, SYNC_LOCK_WAKE_TTL)
             except Exception:
                 pass
 
+    def _run_phase(self, sync_log, loan_type, state, validate_chunk, normalize):
+        """
+        Run one phase over every fetched chunk of state.file_type:
+        validate, normalize the valid rows, then stage them in ClickHouse.
+        """
+        for chunk in self.fetcher.fetch_iter(loan_type, state.file_type):
+            chunk_valid = validate_chunk(chunk)
+            # Drop the raw chunk before the next one is taken from the
+            # fetcher, which already holds the prefetched chunk after it.
+            del chunk
+            if chunk_valid:
+                state.pending += normalize(chunk_valid)
+            self._stage(sync_log, state, loan_type)
+        self._stage(sync_log, state, loan_type, final=True)
+
+    def _validate_credit_chunk(self, chunk, loan_type, state, valid_loan_ids):
+        """Validate one credit chunk; returns its valid rows and records their loan IDs."""
+        validate = self.credit_validator.validate_row
+        add_loan_id = valid_loan_ids.add
+        chunk_valid = []
+        keep = chunk_valid.append
+        row_idx = state.row_idx
+        for row in chunk:
+            row_idx += 1
+            vr = validate(row, row_idx, loan_type)
+            if vr.is_valid:
+                keep(row)
+                loan_id = row.get('loan_account_number', '')
+                if loan_id:
+                    add_loan_id(loan_id)
+            else:
+                state.add_invalid_row(vr.errors)
+        state.row_idx = row_idx
+        return chunk_valid
+
+    def _validate_payment_chunk(self, chunk, loan_type, state, all_valid_loans):
+        """Validate one payment chunk and cross-check it; returns its valid rows."""
+        validate = self.payment_validator.validate_row
+        chunk_valid = []
+        keep = chunk_valid.append
+        row_idx = state.row_idx
+        for row in chunk:
+            row_idx += 1
+            # Field validation
+            vr = validate(row, row_idx, loan_type)
+            if not vr.is_valid:
+                state.add_invalid_row(vr.errors)
+                continue
+
+            # Cross-validation: check loan_account_number exists
+            loan_id = row.get('loan_account_number', '')
+            if loan_id not in all_valid_loans:
+                state.add_cross_reference_error(row_idx, loan_id)
+                continue
+
+            keep(row)
+        state.row_idx = row_idx
+        return chunk_valid
+
+    def _stage(self, sync_log, state, loan_type, final=False):
+        """
+        Insert every whole INSERT_BATCH_SIZE slice of the pending rows into
+        staging, keeping the remainder for the next chunk, and COPY buffered
+        errors once ERROR_FLUSH_ROWS have accumulated. With final=True both
+        are flushed regardless of size.
+        """
+        pending = state.pending
+        size = self.storage_manager.INSERT_BATCH_SIZE
+        ready = len(pending) if final else len(pending) - len(pending) % size
+        if ready:
+            batch, state.pending = pending[:ready], pending[ready:]
+            del pending  # Only the batch and its remainder stay referenced
+            state.valid_count += self.storage_manager.insert_staging(
+                state.context, batch, state.fields,
+                loan_type, self.batch_id, state.loaded_at,
+            )
+        if state.errors and (final or len(state.errors) >= ERROR_FLUSH_ROWS):
+            self._save_errors_batched(sync_log, state.errors, state.file_type)
+            state.errors = []
+
+    def _normalize_credits(self, records, loan_type):
+        """
+        Apply date, rate and category normalization to a chunk in one pass.
+
+        Field lists and the loan-type specific category normalizer are
+        resolved once per chunk instead of once per row.
+        """
+        date_fields = self.date_normalizer.DATE_FIELDS_CREDIT
+        rate_fields = self.rate_normalizer.rate_fields(loan_type)
+        normalize_category = self.category_normalizer.get_credit_normalizer(loan_type)
+        for record in records:
+            get = record.get
+            for field in date_fields:
+                record[field] = normalize_date(get(field, ''))
+            for field in rate_fields:
+                record[field] = normalize_rate(get(field, ''))
+            normalize_category(record)
+        return records
+
+    def _normalize_payments(self, records):
+        """Apply date and category normalization to a chunk in one pass."""
+        date_fields = self.date_normalizer.DATE_FIELDS_PAYMENT
+        normalize_category = self.category_normalizer.normalize_payment
+        for record in records:
+            get = record.get
+            for field in date_fields:
+                record[field] = normalize_date(get(field, ''))
+            normalize_category(record)
+        return records
+
     def _save_errors_batched(self, sync_log, errors, file_type):
-        """Save validation errors in batches to prevent memory spikes."""
+        """
+        Save validation errors with COPY FROM STDIN, one stream per batch.
+
+        COPY streams the whole batch in one round trip without the SQL
+        parsing and parameter binding of a multi-row INSERT; batching only
+        bounds the size of the in-memory text buffer.
+        """
         if not errors:
             return
-        batch = []
-        for err in errors:
-            batch.append(VE(
-                sync_log=sync_log,
-                row_number=err['row_number'],
-                file_type=file_type,
-                field_name=err['field_name'],
-                error_type=err['error_type'],
-                error_message=err['error_message'],
-                raw_value=err.get('raw_value'),
-            ))
-            if len(batch) >= ERROR_SAVE_BATCH:
-                VE.objects.bulk_create(batch, batch_size=ERROR_SAVE_BATCH)
-                batch = []
-        if batch:
-            VE.objects.bulk_create(batch, batch_size=ERROR_SAVE_BATCH)
+        copy_sql = (
+            f"COPY {VE._meta.db_table} (sync_log_id, row_number, file_type, "
+            f"field_name, error_type, error_message, raw_value) FROM STDIN"
+        )
+        sync_log_id = str(sync_log.pk)
+        file_type = _copy_text(file_type)
+        with connection.cursor() as cursor:
+            for start in range(0, len(errors), ERROR_SAVE_BATCH):
+                buf = io.StringIO()
+                write = buf.write
+                for err in errors[start:start + ERROR_SAVE_BATCH]:
+                    write('\t'.join((
+                        sync_log_id,
+                        str(err['row_number']),
+                        file_type,
+                        _copy_text(err['field_name']),
+                        _copy_text(err['error_type']),
+                        _copy_text(err['error_message']),
+                        _copy_text(err.get('raw_value')),
+                    )))
+                    write('\n')
+                buf.seek(0)
+                cursor.copy_expert(copy_sql, buf)
 
     def _cleanup_redis(self, loan_type):
         """Clear upload data from Redis after sync."""
         from external_bank import storage
-        storage.clear_data(self.tenant_id, loan_type, 'credit')
-        storage.clear_data(self.tenant_id, loan_type, 'payment_plan')
+        storage.clear_datasets(self.tenant_id, loan_type, ('credit', 'payment_plan'))
         logger.info("Redis upload data cleared for %s/%s", self.tenant_id, loan_type)
 
     def _update_status(self, sync_log, status):
+        if sync_log.status == status:
+            return
         sync_log.status = status
         sync_log.save(update_fields=['status'])
 
     def _update_sync_config(self, loan_type, status):
-        try:
-            config = SyncConfiguration.objects.get(loan_type=loan_type)
-            config.last_sync_at = datetime.now(timezone.utc)
-            config.last_sync_status = status
-            config.save(update_fields=['last_sync_at', 'last_sync_status'])
-        except SyncConfiguration.DoesNotExist:
-            pass
+        # Single UPDATE, no SELECT of the configuration row first
+        updated = SyncConfiguration.objects.filter(loan_type=loan_type).update(
+            last_sync_at=datetime.now(timezone.utc),
+            last_sync_status=status,
+        )
+        if not updated:
+            logger.debug(
+                "No sync configuration for %s/%s, skipping status update",
+                self.tenant_id, loan_type,
+            )
+
+
+def _copy_text(value):
+    """Encode a value as a field of PostgreSQL's COPY text format."""
+    if value is None:
+        return '\\N'
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
@@ -1,5 +1,6 @@
 """Fetches data from the external bank service."""
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
@@ -40,7 +41,10 @@ class DataFetcher:
     def fetch_iter(self, loan_type: str, file_type: str):
         """
         Generator that yields chunks of records from storage.
-        Truly memory efficient — only one chunk in memory at a time.
+
+        The next chunk is read from Redis and decompressed in a background
+        thread while the caller validates the current one, so at most two
+        chunks are in memory at a time.
 
         Yields:
             Lists of record dicts (each list is one chunk)
@@ -48,9 +52,16 @@ class DataFetcher:
         from external_bank import storage
 
         total = 0
-        for chunk in storage.get_data_iter(self.tenant_id, loan_type, file_type):
-            total += len(chunk)
-            yield chunk
+        chunks = storage.get_data_iter(self.tenant_id, loan_type, file_type)
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='fetch') as pool:
+            pending = pool.submit(next, chunks, None)
+            while True:
+                chunk = pending.result()
+                if chunk is None:
+                    break
+                pending = pool.submit(next, chunks, None)
+                total += len(chunk)
+                yield chunk
 
         logger.info(
             "Fetched %d %s records (streaming) for %s/%s",
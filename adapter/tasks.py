@@ -18,16 +18,19 @@ logger = logging.getLogger(__name__)
 
 SYNC_LOCK_TTL = 600  # 10 minutes max lock duration
 
+# One pool per worker process; check_and_sync polls every minute
+_redis_pool = _redis.ConnectionPool(
+    host=getattr(settings, 'REDIS_HOST', 'redis'),
+    port=6379, db=0,
+)
+
 
 def _get_sync_lock_key(tenant_id: str, loan_type: str) -> str:
     return f"sync_lock:{tenant_id}:{loan_type}"
 
 
 def _get_redis():
-    return _redis.Redis(
-        host=getattr(settings, 'REDIS_HOST', 'redis'),
-        port=6379, db=0,
-    )
+    return _redis.Redis(connection_pool=_redis_pool)
 
 
 @shared_task(name='adapter.tasks.check_and_sync')
@@ -40,40 +43,49 @@ def check_and_sync():
     from external_bank import storage
     from config.db_router import set_current_tenant_schema, clear_current_tenant_schema
 
-    tenants = Tenant.objects.filter(is_active=True)
-    dispatched = 0
-
-    for tenant in tenants:
+    # SyncConfiguration lives in each tenant's schema, so configs are read
+    # per tenant; the Redis probes for all of them are batched below.
+    candidates = []
+    for tenant in Tenant.objects.filter(is_active=True):
         set_current_tenant_schema(tenant.pg_schema)
         try:
-            configs = SyncConfiguration.objects.filter(is_enabled=True)
-            for config in configs:
-                has_credit = storage.get_row_count(
-                    tenant.tenant_id, config.loan_type, 'credit',
-                ) > 0
-                has_payment = storage.get_row_count(
-                    tenant.tenant_id, config.loan_type, 'payment_plan',
-                ) > 0
-
-                if has_credit or has_payment:
-                    # Skip if a sync is already running for this tenant/loan_type
-                    r = _get_redis()
-                    lock_key = _get_sync_lock_key(tenant.tenant_id, config.loan_type)
-                    if r.exists(lock_key):
-                        logger.info(
-                            "Sync already in progress, skipping: %s/%s",
-                            tenant.tenant_id, config.loan_type,
-                        )
-                        continue
-                    run_sync.delay(tenant.tenant_id, config.loan_type)
-                    dispatched += 1
-                    logger.info(
-                        "New data detected, dispatching sync: %s/%s",
-                        tenant.tenant_id, config.loan_type,
-                    )
+            loan_types = SyncConfiguration.objects.filter(
+                is_enabled=True,
+            ).values_list('loan_type', flat=True)
+            candidates.extend((tenant.tenant_id, lt) for lt in loan_types)
         finally:
             clear_current_tenant_schema()
 
+    # One MGET for every upload row count
+    counts = storage.get_row_counts(
+        (tenant_id, loan_type, file_type)
+        for tenant_id, loan_type in candidates
+        for file_type in ('credit', 'payment_plan')
+    )
+    pending = [
+        pair for i, pair in enumerate(candidates)
+        if counts[2 * i] > 0 or counts[2 * i + 1] > 0
+    ]
+
+    dispatched = 0
+    if pending:
+        # Skip pairs with a sync already running; one MGET for all locks
+        r = _get_redis()
+        locks = r.mget([_get_sync_lock_key(t, lt) for t, lt in pending])
+        for (tenant_id, loan_type), lock in zip(pending, locks):
+            if lock is not None:
+                logger.info(
+                    "Sync already in progress, skipping: %s/%s",
+                    tenant_id, loan_type,
+                )
+                continue
+            run_sync.delay(tenant_id, loan_type)
+            dispatched += 1
+            logger.info(
+                "New data detected, dispatching sync: %s/%s",
+                tenant_id, loan_type,
+            )
+
     if dispatched:
         logger.info("check_and_sync: dispatched %d sync tasks", dispatched)
 
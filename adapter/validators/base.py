@@ -1,6 +1,11 @@
 """Base validator classes for data validation."""
+import re
 from dataclasses import dataclass, field
 
+# YYYYMMDD or YYYY-MM-DD in ASCII digits: the formats that validate_date
+# accepts without falling back to its general checks
+_DATE_RE = re.compile(r'(\d{4})-?(\d{2})-?(\d{2})', re.ASCII)
+
 
 @dataclass
 class ValidationResult:
@@ -67,6 +72,74 @@ class BaseValidator:
             return False
         return True
 
+    def validate_required_fields(self, result: ValidationResult, row: dict,
+                                 field_names, file_type: str):
+        """validate_required for each field; only missing values take the slow path."""
+        get = row.get
+        for field_name in field_names:
+            if not get(field_name, '').strip():
+                self.validate_required(result, row, field_name, file_type)
+
+    def validate_integers(self, result: ValidationResult, row: dict, fields):
+        """
+        validate_integer over (field_name, min_val) pairs.
+
+        Values are parsed inline and validate_integer is only called for the
+        ones that fail, so it still produces every error.
+        """
+        get = row.get
+        for field_name, min_val in fields:
+            value = get(field_name, '').strip()
+            if not value:
+                continue
+            try:
+                int_val = int(value)
+            except ValueError:
+                pass
+            else:
+                if min_val is None or int_val >= min_val:
+                    continue
+            self.validate_integer(result, row, field_name, min_val=min_val)
+
+    def validate_decimals(self, result: ValidationResult, row: dict, fields):
+        """validate_decimal over (field_name, min_val, max_val) triples, checked like validate_integers."""
+        get = row.get
+        for field_name, min_val, max_val in fields:
+            value = get(field_name, '').strip()
+            if not value:
+                continue
+            try:
+                float_val = float(value)
+            except ValueError:
+                pass
+            else:
+                if ((min_val is None or float_val >= min_val)
+                        and (max_val is None or float_val <= max_val)):
+                    continue
+            self.validate_decimal(result, row, field_name, min_val=min_val, max_val=max_val)
+
+    def validate_dates(self, result: ValidationResult, row: dict, field_names):
+        """
+        validate_date for each field.
+
+        Well-formed dates are matched with one regex and range-checked on
+        the zero-padded digit strings; anything else goes through
+        validate_date for the full checks and error messages.
+        """
+        get = row.get
+        match = _DATE_RE.fullmatch
+        for field_name in field_names:
+            value = get(field_name, '').strip()
+            if not value:
+                continue
+            m = match(value)
+            if m:
+                year, month, day = m.groups()
+                if ('1900' <= year <= '2100' and '01' <= month <= '12'
+                        and '01' <= day <= '31'):
+                    continue
+            self.validate_date(result, row, field_name)
+
     def validate_integer(self, result: ValidationResult, row: dict,
                          field_name: str, min_val=None, max_val=None):
         value = row.get(field_name, '').strip()
@@ -98,7 +171,7 @@ class BaseValidator:
             return False
 
     def validate_decimal(self, result: ValidationResult, row: dict,
-                         field_name: str, min_val=None):
+                         field_name: str, min_val=None, max_val=None):
         value = row.get(field_name, '').strip()
         if not value:
             return True
@@ -111,6 +184,13 @@ class BaseValidator:
                     raw_value=value,
                 )
                 return False
+            if max_val is not None and float_val > max_val:
+                result.add_error(
+                    field_name, 'RANGE',
+                    f'{field_name} must be <= {max_val}, got {float_val}',
+                    raw_value=value,
+                )
+                return False
             return True
         except ValueError:
             result.add_error(
@@ -40,14 +40,13 @@ class CrossFileValidator:
         # Get existing loan account numbers from ClickHouse
         existing_loans = self._get_existing_loans(ch_database, loan_type)
 
-        # Union of both
-        valid_loans = batch_loans | existing_loans
-
+        # Checked against both sets in turn rather than copying the
+        # (potentially large) existing set into a union
         for idx, row in enumerate(payment_records, start=1):
             vr = ValidationResult(row_number=idx)
             loan_num = row.get('loan_account_number', '').strip()
 
-            if loan_num and loan_num not in valid_loans:
+            if loan_num and loan_num not in batch_loans and loan_num not in existing_loans:
                 vr.add_error(
                     'loan_account_number', 'CROSS_REFERENCE',
                     f'Payment references non-existent credit: {loan_num}',
@@ -75,7 +74,7 @@ class CrossFileValidator:
                 "WHERE loan_type = {loan_type:String}",
                 parameters={'loan_type': loan_type},
             )
-            loan_set = {row[0] for row in query_result.result_rows}
+            loan_set = set(query_result.result_columns[0]) if query_result.row_count else set()
             cache_set(key, list(loan_set), TTL_EXISTING_LOANS)
             return loan_set
         except Exception as e:
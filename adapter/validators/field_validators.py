@@ -1,6 +1,10 @@
 """Field-level validators for credit and payment plan data."""
 from .base import BaseValidator, ValidationResult
 
+# Rate columns are Decimal32(6) (|x| < 1000) and RateNormalizer divides
+# values above 1 by 100, so raw rates must stay below 100000.
+MAX_RATE = 99999.999999
+
 
 class CreditFieldValidator(BaseValidator):
     """Validates individual fields in credit records."""
@@ -14,12 +18,38 @@ class CreditFieldValidator(BaseValidator):
     VALID_CUSTOMER_TYPES = {'I', 'T', 'V'}
     VALID_STATUS_CODES = {'A', 'K'}
 
+    # (field_name, min_val, max_val)
+    DECIMAL_FIELDS = (
+        ('original_loan_amount', 0, None),
+        ('outstanding_principal_balance', 0, None),
+        ('nominal_interest_rate', 0, MAX_RATE),
+        ('total_interest_amount', 0, None),
+        ('kkdf_rate', 0, MAX_RATE),
+        ('kkdf_amount', 0, None),
+        ('bsmv_rate', 0, MAX_RATE),
+        ('bsmv_amount', 0, None),
+    )
+    # (field_name, min_val)
+    INTEGER_FIELDS = (
+        ('days_past_due', 0),
+        ('total_installment_count', 0),
+        ('outstanding_installment_count', 0),
+        ('paid_installment_count', 0),
+        ('grace_period_months', 0),
+        ('installment_frequency', 0),
+        ('internal_rating', None),
+        ('external_rating', None),
+    )
+    DATE_FIELDS = (
+        'final_maturity_date', 'first_payment_date',
+        'loan_start_date', 'loan_closing_date',
+    )
+
     def validate_row(self, row: dict, row_number: int, loan_type: str) -> ValidationResult:
         result = ValidationResult(row_number=row_number)
 
         # Required fields
-        for field_name in self.COMMON_REQUIRED:
-            self.validate_required(result, row, field_name, 'credit')
+        self.validate_required_fields(result, row, self.COMMON_REQUIRED, 'credit')
 
         # Customer type
         self.validate_in_set(result, row, 'customer_type', self.VALID_CUSTOMER_TYPES)
@@ -28,30 +58,13 @@ class CreditFieldValidator(BaseValidator):
         self.validate_in_set(result, row, 'loan_status_code', self.VALID_STATUS_CODES)
 
         # Numeric fields
-        self.validate_decimal(result, row, 'original_loan_amount', min_val=0)
-        self.validate_decimal(result, row, 'outstanding_principal_balance', min_val=0)
-        self.validate_decimal(result, row, 'nominal_interest_rate', min_val=0)
-        self.validate_decimal(result, row, 'total_interest_amount', min_val=0)
-        self.validate_decimal(result, row, 'kkdf_rate', min_val=0)
-        self.validate_decimal(result, row, 'kkdf_amount', min_val=0)
-        self.validate_decimal(result, row, 'bsmv_rate', min_val=0)
-        self.validate_decimal(result, row, 'bsmv_amount', min_val=0)
+        self.validate_decimals(result, row, self.DECIMAL_FIELDS)
 
         # Integer fields
-        self.validate_integer(result, row, 'days_past_due', min_val=0)
-        self.validate_integer(result, row, 'total_installment_count', min_val=0)
-        self.validate_integer(result, row, 'outstanding_installment_count', min_val=0)
-        self.validate_integer(result, row, 'paid_installment_count', min_val=0)
-        self.validate_integer(result, row, 'grace_period_months', min_val=0)
-        self.validate_integer(result, row, 'installment_frequency', min_val=0)
-        self.validate_integer(result, row, 'internal_rating')
-        self.validate_integer(result, row, 'external_rating')
+        self.validate_integers(result, row, self.INTEGER_FIELDS)
 
         # Date fields
-        self.validate_date(result, row, 'final_maturity_date')
-        self.validate_date(result, row, 'first_payment_date')
-        self.validate_date(result, row, 'loan_start_date')
-        self.validate_date(result, row, 'loan_closing_date')
+        self.validate_dates(result, row, self.DATE_FIELDS)
 
         # Retail-specific
         if loan_type == 'RETAIL':
@@ -68,7 +81,9 @@ class CreditFieldValidator(BaseValidator):
             self.validate_integer(result, row, 'loan_product_type')
             self.validate_integer(result, row, 'sector_code')
             self.validate_integer(result, row, 'internal_credit_rating')
-            self.validate_decimal(result, row, 'default_probability', min_val=0)
+            self.validate_decimal(
+                result, row, 'default_probability', min_val=0, max_val=MAX_RATE,
+            )
             self.validate_integer(result, row, 'risk_class')
             self.validate_integer(result, row, 'customer_segment')
 
@@ -85,32 +100,36 @@ class PaymentFieldValidator(BaseValidator):
 
     VALID_STATUSES = {'A', 'K'}
 
+    # (field_name, min_val, max_val)
+    DECIMAL_FIELDS = (
+        ('installment_amount', 0, None),
+        ('principal_component', 0, None),
+        ('interest_component', 0, None),
+        ('kkdf_component', 0, None),
+        ('bsmv_component', 0, None),
+        ('remaining_principal', 0, None),
+        ('remaining_interest', 0, None),
+        ('remaining_kkdf', 0, None),
+        ('remaining_bsmv', 0, None),
+    )
+    DATE_FIELDS = ('actual_payment_date', 'scheduled_payment_date')
+
     def validate_row(self, row: dict, row_number: int, loan_type: str) -> ValidationResult:
         result = ValidationResult(row_number=row_number)
 
         # Required fields
-        for field_name in self.REQUIRED_FIELDS:
-            self.validate_required(result, row, field_name, 'payment_plan')
+        self.validate_required_fields(result, row, self.REQUIRED_FIELDS, 'payment_plan')
 
         # Installment number
         self.validate_integer(result, row, 'installment_number', min_val=1)
 
         # Amount fields
-        self.validate_decimal(result, row, 'installment_amount', min_val=0)
-        self.validate_decimal(result, row, 'principal_component', min_val=0)
-        self.validate_decimal(result, row, 'interest_component', min_val=0)
-        self.validate_decimal(result, row, 'kkdf_component', min_val=0)
-        self.validate_decimal(result, row, 'bsmv_component', min_val=0)
-        self.validate_decimal(result, row, 'remaining_principal', min_val=0)
-        self.validate_decimal(result, row, 'remaining_interest', min_val=0)
-        self.validate_decimal(result, row, 'remaining_kkdf', min_val=0)
-        self.validate_decimal(result, row, 'remaining_bsmv', min_val=0)
+        self.validate_decimals(result, row, self.DECIMAL_FIELDS)
 
         # Status
         self.validate_in_set(result, row, 'installment_status', self.VALID_STATUSES)
 
         # Dates
-        self.validate_date(result, row, 'actual_payment_date')
-        self.validate_date(result, row, 'scheduled_payment_date')
+        self.validate_dates(result, row, self.DATE_FIELDS)
 
         return result
@@ -0,0 +1,61 @@
+"""
+Password hasher for tenant API keys.
+
+API keys are 192-bit random tokens, so key stretching (PBKDF2's 600k
+iterations) adds CPU cost on every authenticated request without adding
+security. A single SHA-256 over the key is enough to keep the stored
+value non-reversible.
+
+Stored as "sha256$$<hexdigest>". Keys hashed before this hasher existed
+keep verifying through PBKDF2 via PASSWORD_HASHERS.
+
+Must stay last in PASSWORD_HASHERS: the first entry hashes new User
+passwords, and those need a salted, stretched hasher.
+"""
+import hashlib
+
+from django.contrib.auth.hashers import BasePasswordHasher, mask_hash
+from django.utils.crypto import constant_time_compare
+from django.utils.translation import gettext_noop as _
+
+
+class ApiKeySHA256Hasher(BasePasswordHasher):
+    """Unsalted, single-round SHA-256. Only for high-entropy API keys."""
+
+    algorithm = 'sha256'
+
+    def salt(self):
+        return ''
+
+    def encode(self, password, salt):
+        if salt != '':
+            raise ValueError('ApiKeySHA256Hasher does not use a salt.')
+        digest = hashlib.sha256(password.encode()).hexdigest()
+        return f'{self.algorithm}$${digest}'
+
+    def decode(self, encoded):
+        algorithm, empty, digest = encoded.split('$', 2)
+        assert algorithm == self.algorithm
+        return {
+            'algorithm': algorithm,
+            'hash': digest,
+            'salt': None,
+        }
+
+    def verify(self, password, encoded):
+        return constant_time_compare(encoded, self.encode(password, ''))
+
+    def safe_summary(self, encoded):
+        decoded = self.decode(encoded)
+        return {
+            _('algorithm'): decoded['algorithm'],
+            _('hash'): mask_hash(decoded['hash']),
+        }
+
+    def harden_runtime(self, password, encoded):
+        pass
+
+
+def make_api_key_hash(raw_api_key):
+    """Hash a freshly generated API key for storage on Tenant.api_key_hash."""
+    return ApiKeySHA256Hasher().encode(raw_api_key, '')
@@ -8,6 +8,7 @@ from rest_framework.views import APIView
 from adapter.models import SyncLog, SyncConfiguration, ValidationError
 from adapter.sync.engine import SyncEngine
 from config.db_router import set_current_tenant_schema, clear_current_tenant_schema
+from core.cache import cache_get_or_set, profile_key, PROFILE_DATA_TYPES, TTL_PROFILE
 from .authentication import ApiKeyAuthentication
 from .permissions import TenantIsolationPermission
 from .serializers import (
@@ -215,7 +216,7 @@ class DataView(TenantMixin, APIView):
 
 
 class ProfilingView(TenantMixin, APIView):
-    """Data profiling endpoint - queries ClickHouse directly."""
+    """Data profiling endpoint - queries ClickHouse, cached until the next sync."""
 
     def get(self, request):
         from adapter.profiling.engine import ProfilingEngine
@@ -237,9 +238,26 @@ class ProfilingView(TenantMixin, APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        # Only values whose cache entry invalidate_after_sync clears
+        if loan_type not in dict(SyncConfiguration.LOAN_TYPE_CHOICES):
+            return Response(
+                {'error': f'Unknown loan_type: {loan_type}'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if data_type not in PROFILE_DATA_TYPES:
+            return Response(
+                {'error': f"data_type must be one of {', '.join(PROFILE_DATA_TYPES)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         engine = ProfilingEngine(tenant.ch_database)
         try:
-            profile = engine.profile(loan_type, data_type)
+            # Shares the frontend's cache entry; invalidated after each sync
+            profile = cache_get_or_set(
+                profile_key(tenant.tenant_id, loan_type, data_type),
+                lambda: engine.profile(loan_type, data_type),
+                TTL_PROFILE,
+            )
             return Response(profile)
         except Exception as e:
             logger.error("Profiling error: %s", e)
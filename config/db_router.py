@@ -8,12 +8,35 @@ logger = logging.getLogger(__name__)
 _thread_local = threading.local()
 
 
+def _search_path_is(schema_name):
+    """
+    Whether search_path on the open connection is already schema_name.
+
+    The remembered value is tied to the underlying DB-API connection, so a
+    reconnect always re-issues SET.
+    """
+    return (
+        connection.connection is not None
+        and getattr(_thread_local, 'search_path', None) == (connection.connection, schema_name)
+    )
+
+
+def _remember_search_path(schema_name):
+    # SET is transactional in PostgreSQL: a rollback would silently restore
+    # the previous search_path, so only autocommit-mode SETs are remembered.
+    if connection.in_atomic_block:
+        _thread_local.search_path = None
+    else:
+        _thread_local.search_path = (connection.connection, schema_name)
+
+
 def set_current_tenant_schema(schema_name):
     """Set the current tenant's schema via search_path."""
     _thread_local.tenant_schema = schema_name
-    if schema_name:
+    if schema_name and not _search_path_is(schema_name):
         with connection.cursor() as cursor:
             cursor.execute("SET search_path TO %s, public", [schema_name])
+        _remember_search_path(schema_name)
 
 
 def get_current_tenant_schema():
@@ -24,9 +47,12 @@ def get_current_tenant_schema():
 def clear_current_tenant_schema():
     """Reset search_path to public only."""
     _thread_local.tenant_schema = None
+    if _search_path_is(None):
+        return
     try:
         with connection.cursor() as cursor:
             cursor.execute("SET search_path TO public")
+        _remember_search_path(None)
     except Exception:
         pass
 
@@ -89,6 +89,11 @@ CLICKHOUSE_HOST = os.environ.get('CLICKHOUSE_HOST', 'localhost')
 CLICKHOUSE_PORT = int(os.environ.get('CLICKHOUSE_PORT', '8123'))
 CLICKHOUSE_USER = os.environ.get('CLICKHOUSE_USER', 'default')
 CLICKHOUSE_PASSWORD = os.environ.get('CLICKHOUSE_PASSWORD', '')
+# Rows per staging INSERT; above the 65,536-row server block so each
+# insert lands as whole blocks rather than a trailing partial one.
+# Memory per running sync scales with it (~1.5 GB at the default, see
+# .env.example); lower it for memory-constrained workers.
+CLICKHOUSE_INSERT_BATCH_SIZE = int(os.environ.get('CLICKHOUSE_INSERT_BATCH_SIZE', '200000'))
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -98,6 +103,19 @@ AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
 ]
 
+# Password hashers. PBKDF2 stays the default for user passwords;
+# ApiKeySHA256Hasher verifies tenant API keys (see api/hashers.py).
+# The first entry is the default for new User passwords, so the unsalted
+# API key hasher must stay last (tests/test_hashers.py checks this).
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'api.hashers.ApiKeySHA256Hasher',
+]
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
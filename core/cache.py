@@ -24,7 +24,7 @@ TTL_SYNC_CONFIG = 120            # 2 min
 TTL_SYNC_LOGS = 60               # 1 min
 TTL_CH_COUNT = 300               # 5 min
 TTL_CH_SCHEMA = 3600             # 1 hour
-TTL_PROFILE = 600                # 10 min
+TTL_PROFILE = 3600               # 1 hour (also invalidated after every sync)
 TTL_VALIDATION_ERRORS = 1800     # 30 min
 TTL_EXISTING_LOANS = 300         # 5 min
 
@@ -56,6 +56,11 @@ def ch_schema_key(tenant_id: str, table: str) -> str:
     return _key(tenant_id, 'ch_schema', table)
 
 
+# data_type values a profile can be cached under; all of them are
+# invalidated after a sync
+PROFILE_DATA_TYPES = ('credit', 'payment')
+
+
 def profile_key(tenant_id: str, loan_type: str, data_type: str) -> str:
     return _key(tenant_id, 'profile', loan_type, data_type)
 
@@ -135,10 +140,12 @@ def invalidate_after_sync(tenant_id: str, loan_type: str) -> None:
         sync_logs_key(tenant_id, 20),
         ch_count_key(tenant_id, 'fact_credit', loan_type),
         ch_count_key(tenant_id, 'fact_payment', loan_type),
-        profile_key(tenant_id, loan_type, 'credit'),
-        profile_key(tenant_id, loan_type, 'payment'),
         existing_loans_key(tenant_id, loan_type),
     ]
+    keys_to_delete += [
+        profile_key(tenant_id, loan_type, data_type)
+        for data_type in PROFILE_DATA_TYPES
+    ]
     logger.info(
         "Invalidating %d cache keys after sync: tenant=%s loan_type=%s",
         len(keys_to_delete), tenant_id, loan_type,
@@ -174,20 +174,48 @@ def get_row_count(tenant_id, loan_type, file_type):
     return int(val) if val else 0
 
 
+def get_row_counts(datasets):
+    """
+    Row counts for many (tenant_id, loan_type, file_type) datasets in a
+    single MGET, in the order given.
+    """
+    datasets = list(datasets)
+    if not datasets:
+        return []
+    values = _redis.mget([_count_key(*ds) for ds in datasets])
+    return [int(val) if val else 0 for val in values]
+
+
 def clear_data(tenant_id=None, loan_type=None, file_type=None):
     """Clear uploaded data (uses SCAN, non-blocking)."""
     if tenant_id and loan_type and file_type:
-        _clear_chunks(tenant_id, loan_type, file_type)
-        _redis.delete(
-            _count_key(tenant_id, loan_type, file_type),
-            _chunk_count_key(tenant_id, loan_type, file_type),
-        )
+        clear_datasets(tenant_id, loan_type, (file_type,))
     elif tenant_id:
         _scan_delete(f"{_PREFIX}{tenant_id}:*")
     else:
         _scan_delete(f"{_PREFIX}*")
 
 
+def clear_datasets(tenant_id, loan_type, file_types):
+    """
+    Clear one or more uploaded datasets of a tenant/loan_type.
+    One MGET for the chunk counts and one DEL for every key, however
+    many file types are cleared.
+    """
+    counts = _redis.mget(
+        [_chunk_count_key(tenant_id, loan_type, ft) for ft in file_types]
+    )
+    keys = []
+    for file_type, val in zip(file_types, counts):
+        num_chunks = int(val) if val else 0
+        keys.extend(
+            _chunk_key(tenant_id, loan_type, file_type, i) for i in range(num_chunks)
+        )
+        keys.append(_count_key(tenant_id, loan_type, file_type))
+        keys.append(_chunk_count_key(tenant_id, loan_type, file_type))
+    _redis.delete(*keys)
+
+
 def _clear_chunks(tenant_id, loan_type, file_type):
     """Clear all chunk keys for a given dataset."""
     num_chunks = _get_num_chunks(tenant_id, loan_type, file_type)
@@ -5,7 +5,7 @@ import json
 import logging
 import secrets
 
-from django.contrib.auth.hashers import check_password, make_password
+from django.contrib.auth.hashers import check_password
 from django.http import JsonResponse, HttpResponse
 from django.shortcuts import render, redirect
 from django.views import View
@@ -15,10 +15,12 @@ from adapter.clickhouse_manager import get_clickhouse_client
 from adapter.metrics import data_upload_bytes_total
 from adapter.profiling.engine import ProfilingEngine
 from adapter.sync.engine import SyncEngine
+from api.hashers import make_api_key_hash
 from config.db_router import set_current_tenant_schema, clear_current_tenant_schema
 from core.cache import (
     cache_get_or_set, sync_configs_key, sync_logs_key,
     ch_count_key, ch_schema_key, profile_key, validation_errors_key,
+    PROFILE_DATA_TYPES,
     invalidate_tenant_auth,
     TTL_SYNC_CONFIG, TTL_SYNC_LOGS, TTL_CH_COUNT, TTL_CH_SCHEMA,
     TTL_PROFILE, TTL_VALIDATION_ERRORS,
@@ -483,6 +485,12 @@ class ProfilingPageView(View):
 
         loan_type = request.GET.get('loan_type', 'RETAIL')
         data_type = request.GET.get('data_type', 'credit')
+        # Fall back to the defaults so every cached profile is one that
+        # invalidate_after_sync clears
+        if loan_type not in dict(SyncConfiguration.LOAN_TYPE_CHOICES):
+            loan_type = 'RETAIL'
+        if data_type not in PROFILE_DATA_TYPES:
+            data_type = 'credit'
 
         profile = {}
         try:
@@ -682,7 +690,7 @@ class SettingsView(View):
 
         # Generate new key
         raw_api_key = f"sk_live_{secrets.token_hex(24)}"
-        tenant.api_key_hash = make_password(raw_api_key)
+        tenant.api_key_hash = make_api_key_hash(raw_api_key)
         tenant.api_key_prefix = raw_api_key[:16]
         tenant.save(update_fields=['api_key_hash', 'api_key_prefix'])
 
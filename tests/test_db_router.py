@@ -0,0 +1,59 @@
+"""Tests for the per-connection search_path cache in the tenant router."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from config import db_router
+from config.db_router import clear_current_tenant_schema, set_current_tenant_schema
+
+
+@pytest.fixture
+def connection():
+    conn = MagicMock(in_atomic_block=False)
+    conn.connection = object()  # Underlying DB-API connection
+    db_router._thread_local.__dict__.clear()
+    with patch.object(db_router, 'connection', conn):
+        yield conn
+    db_router._thread_local.__dict__.clear()
+
+
+def _executed(connection):
+    cursor = connection.cursor.return_value.__enter__.return_value
+    return [c.args[0] for c in cursor.execute.call_args_list]
+
+
+class TestSearchPathCache:
+    def test_repeated_set_on_same_connection_skipped(self, connection):
+        set_current_tenant_schema('bank001')
+        set_current_tenant_schema('bank001')
+        assert _executed(connection) == ["SET search_path TO %s, public"]
+        assert db_router.get_current_tenant_schema() == 'bank001'
+
+    def test_other_schema_is_set(self, connection):
+        set_current_tenant_schema('bank001')
+        set_current_tenant_schema('bank002')
+        assert len(_executed(connection)) == 2
+
+    def test_new_connection_forces_set(self, connection):
+        set_current_tenant_schema('bank001')
+        connection.connection = object()  # Reconnected
+        set_current_tenant_schema('bank001')
+        assert len(_executed(connection)) == 2
+
+    def test_set_inside_atomic_reissued_after_rollback(self, connection):
+        connection.in_atomic_block = True
+        set_current_tenant_schema('bank001')
+        # The transaction rolled back, taking the SET with it
+        connection.in_atomic_block = False
+        set_current_tenant_schema('bank001')
+        set_current_tenant_schema('bank001')
+        assert len(_executed(connection)) == 2
+
+    def test_clear_skipped_when_already_public(self, connection):
+        set_current_tenant_schema('bank001')
+        clear_current_tenant_schema()
+        clear_current_tenant_schema()
+        assert _executed(connection) == [
+            "SET search_path TO %s, public", "SET search_path TO public",
+        ]
+        assert db_router.get_current_tenant_schema() is None
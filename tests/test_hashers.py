@@ -0,0 +1,40 @@
+"""Tests for the tenant API key hasher."""
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    check_password, get_hasher, identify_hasher, make_password,
+)
+
+from api.hashers import ApiKeySHA256Hasher, make_api_key_hash
+
+
+RAW_KEY = 'bank001-3q2Xo9c1bS7mW4kZpV8rT0aHnL6yJdEf'
+
+
+class TestApiKeySHA256Hasher:
+    def test_roundtrip(self):
+        encoded = make_api_key_hash(RAW_KEY)
+        assert encoded.startswith('sha256$$')
+        assert check_password(RAW_KEY, encoded)
+
+    def test_wrong_key_rejected(self):
+        encoded = make_api_key_hash(RAW_KEY)
+        assert not check_password(RAW_KEY + 'x', encoded)
+        assert not check_password('', encoded)
+
+    def test_identify_hasher(self):
+        hasher = identify_hasher(make_api_key_hash(RAW_KEY))
+        assert isinstance(hasher, ApiKeySHA256Hasher)
+        assert hasher.algorithm == 'sha256'
+
+    def test_existing_pbkdf2_hash_still_verifies(self):
+        # Keys stored before the SHA-256 hasher was added
+        encoded = make_password(RAW_KEY, hasher='pbkdf2_sha256')
+        assert check_password(RAW_KEY, encoded)
+        assert not check_password(RAW_KEY + 'x', encoded)
+
+    def test_not_the_default_password_hasher(self):
+        # User passwords must keep using PBKDF2; the unsalted hasher is
+        # only for high-entropy API keys and has to stay last in the list.
+        assert settings.PASSWORD_HASHERS[-1] == 'api.hashers.ApiKeySHA256Hasher'
+        assert get_hasher('default').algorithm == 'pbkdf2_sha256'
+        assert make_password('user-password').startswith('pbkdf2_sha256$')
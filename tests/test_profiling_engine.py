@@ -0,0 +1,176 @@
+"""Tests for the single-scan profiling queries and their result parsing."""
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from adapter.profiling import engine
+from adapter.profiling.engine import ProfilingEngine
+
+
+COLUMNS = [
+    ('batch_id', 'UUID'),
+    ('loan_type', 'LowCardinality(String)'),
+    ('loaded_at', 'DateTime'),
+    ('loan_account_number', 'String'),
+    ('days_past_due', 'UInt32'),
+    ('internal_rating', 'Nullable(UInt8)'),
+    ('final_maturity_date', 'Nullable(Date)'),
+    ('insurance_included', 'LowCardinality(Nullable(String))'),
+    ('total_installment_count', 'UInt16'),
+]
+NUMERIC_FIELDS = ['days_past_due', 'internal_rating']
+NULLABLE_FIELDS = ['internal_rating', 'final_maturity_date', 'insurance_included']
+
+
+class _FakeClient:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def query(self, query, parameters=None):
+        if 'system.columns' in query:
+            return SimpleNamespace(result_rows=COLUMNS)
+        self.queries.append((query, parameters))
+        return SimpleNamespace(result_rows=self.rows)
+
+
+@pytest.fixture(autouse=True)
+def no_schema_cache():
+    with patch.object(engine, 'cache_get_or_set', lambda key, compute, ttl: compute()):
+        yield
+
+
+def _select_list(query):
+    return query[len('SELECT '):query.index(' FROM ')].split(', ')
+
+
+class TestScalarStats:
+    def _stats(self, rows):
+        client = _FakeClient(rows)
+        stats = ProfilingEngine('bank001_dw')._get_scalar_stats(
+            client, 'fact_credit', 'RETAIL', 'credit', NUMERIC_FIELDS, NULLABLE_FIELDS,
+        )
+        return client, stats
+
+    def test_select_list(self):
+        client, _ = self._stats([])
+        [(query, parameters)] = client.queries
+        assert _select_list(query) == [
+            'count()',
+            'min(days_past_due)', 'max(days_past_due)', 'avg(days_past_due)',
+            'stddevPop(days_past_due)', 'countIf(days_past_due = 0)',
+            'min(internal_rating)', 'max(internal_rating)', 'avg(internal_rating)',
+            'stddevPop(internal_rating)',
+            'countIf(internal_rating = 0 OR isNull(internal_rating))',
+            # Null ratios: null map subcolumn unless LowCardinality(Nullable)
+            'sum(internal_rating.null) / count()',
+            'sum(final_maturity_date.null) / count()',
+            'countIf(isNull(insurance_included)) / count()',
+            # Completeness, in column order, numeric and meta fields excluded
+            "countIf(loan_account_number = '')",
+            'sum(final_maturity_date.null)',
+            'countIf(isNull(insurance_included))',
+            '0',
+        ]
+        assert query.endswith('FROM fact_credit WHERE loan_type = {loan_type:String}')
+        assert parameters == {'loan_type': 'RETAIL'}
+
+    def test_row_split_into_sections(self):
+        row = (
+            4,
+            0, 90, 30.0, Decimal('36.74'), 2,
+            1, 9, 5.0, 2.0, 1,
+            0.25, 0.5, 1 / 3,
+            1, 2, 0, 0,
+        )
+        _, stats = self._stats([row])
+        assert stats['row_count'] == 4
+        assert stats['numeric_stats'] == {
+            'days_past_due': {
+                'min': 0.0, 'max': 90.0, 'avg': 30.0, 'stddev': 36.74,
+                'total_count': 4, 'zero_or_null_count': 2, 'zero_or_null_ratio': 0.5,
+            },
+            'internal_rating': {
+                'min': 1.0, 'max': 9.0, 'avg': 5.0, 'stddev': 2.0,
+                'total_count': 4, 'zero_or_null_count': 1, 'zero_or_null_ratio': 0.25,
+            },
+        }
+        assert stats['null_ratios'] == {
+            'internal_rating': 0.25,
+            'final_maturity_date': 0.5,
+            'insurance_included': 0.3333,
+        }
+        assert stats['completeness'] == {
+            'loan_account_number': {
+                'missing_count': 1, 'missing_pct': 25.0, 'filled_pct': 75.0, 'total': 4,
+            },
+            'final_maturity_date': {
+                'missing_count': 2, 'missing_pct': 50.0, 'filled_pct': 50.0, 'total': 4,
+            },
+            'insurance_included': {
+                'missing_count': 0, 'missing_pct': 0.0, 'filled_pct': 100.0, 'total': 4,
+            },
+            'total_installment_count': {
+                'missing_count': 0, 'missing_pct': 0.0, 'filled_pct': 100.0, 'total': 4,
+            },
+        }
+
+    def test_no_result_rows(self):
+        _, stats = self._stats([])
+        assert stats == {
+            'row_count': 0, 'numeric_stats': {}, 'null_ratios': {}, 'completeness': {},
+        }
+
+
+class TestCategoricalStats:
+    FIELDS = ['customer_type', 'insurance_included', 'customer_district_code']
+
+    def _stats(self, rows, fields=FIELDS):
+        client = _FakeClient(rows)
+        stats = ProfilingEngine('bank001_dw')._get_categorical_stats(
+            client, 'fact_credit', 'RETAIL', fields,
+        )
+        return client, stats
+
+    def test_one_array_join_query(self):
+        client, _ = self._stats([])
+        [(query, parameters)] = client.queries
+        assert (
+            'ARRAY JOIN [(0, toString(customer_type)), (1, toString(insurance_included)), '
+            '(2, toString(customer_district_code))] AS kv'
+        ) in query
+        assert 'GROUP BY field_idx, value' in query
+        assert parameters == {'loan_type': 'RETAIL'}
+
+    def test_rows_split_by_field_index(self):
+        rows = [
+            (0, 'I', 3), (0, 'T', 1),
+            (1, 'H', 2), (1, None, 2),
+            (2, '', 4),
+        ]
+        _, stats = self._stats(rows)
+        assert stats == {
+            'customer_type': {
+                'unique_count': 2,
+                'values': [
+                    {'value': 'I', 'frequency': 3},
+                    {'value': 'T', 'frequency': 1},
+                ],
+            },
+            # Missing values are listed but not counted as distinct
+            'insurance_included': {
+                'unique_count': 1,
+                'values': [
+                    {'value': 'H', 'frequency': 2},
+                    {'value': None, 'frequency': 2},
+                ],
+            },
+            # customer_district_code has no non-missing value and is skipped
+        }
+
+    def test_no_fields_no_query(self):
+        client, stats = self._stats([], fields=[])
+        assert stats == {}
+        assert client.queries == []
@@ -54,6 +54,17 @@ class TestExternalBankStorage:
         result = storage.get_data('BANK999', 'RETAIL', 'credit')
         assert result == []
 
+    def test_get_row_counts(self):
+        storage.store_data('BANK001', 'RETAIL', 'credit', [{'a': '1'}] * 3)
+        storage.store_data('BANK002', 'RETAIL', 'payment_plan', [{'b': '2'}])
+
+        assert storage.get_row_counts([
+            ('BANK001', 'RETAIL', 'credit'),
+            ('BANK001', 'RETAIL', 'payment_plan'),
+            ('BANK002', 'RETAIL', 'payment_plan'),
+        ]) == [3, 0, 1]
+        assert storage.get_row_counts([]) == []
+
     def test_clear_specific(self):
         storage.store_data('BANK001', 'RETAIL', 'credit', [{'a': '1'}])
         storage.store_data('BANK001', 'RETAIL', 'payment_plan', [{'b': '2'}])
@@ -62,6 +73,16 @@ class TestExternalBankStorage:
         assert storage.get_data('BANK001', 'RETAIL', 'credit') == []
         assert len(storage.get_data('BANK001', 'RETAIL', 'payment_plan')) == 1
 
+    def test_clear_datasets(self):
+        storage.store_data('BANK001', 'RETAIL', 'credit', [{'a': '1'}] * 3)
+        storage.store_data('BANK001', 'RETAIL', 'payment_plan', [{'b': '2'}])
+        storage.store_data('BANK001', 'COMMERCIAL', 'credit', [{'c': '3'}])
+        storage.clear_datasets('BANK001', 'RETAIL', ('credit', 'payment_plan'))
+
+        assert storage.get_data('BANK001', 'RETAIL', 'credit') == []
+        assert storage.get_row_count('BANK001', 'RETAIL', 'payment_plan') == 0
+        assert len(storage.get_data('BANK001', 'COMMERCIAL', 'credit')) == 1
+
     def test_clear_tenant(self):
         storage.store_data('BANK001', 'RETAIL', 'credit', [{'a': '1'}])
         storage.store_data('BANK001', 'COMMERCIAL', 'credit', [{'b': '2'}])
@@ -0,0 +1,141 @@
+"""Tests for ClickHouse row/column preparation in StorageManager."""
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from adapter.storage import manager
+from adapter.storage.manager import StorageManager
+
+
+NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+
+class TestColumnPreparation:
+    def _column(self, columns, fields, key):
+        # Columns after the batch_id/loan_type/loaded_at prefix follow fields
+        return columns[3 + [f[0] for f in fields].index(key)]
+
+    def test_fields_follow_column_order(self):
+        assert StorageManager._CREDIT_COLUMNS[3:] == tuple(f[0] for f in manager._CREDIT_FIELDS)
+        assert StorageManager._PAYMENT_COLUMNS[3:] == tuple(f[0] for f in manager._PAYMENT_FIELDS)
+
+    def test_prefix_columns(self):
+        columns = manager._build_columns(
+            [{}, {}], manager._PAYMENT_FIELDS, 'RETAIL', 'batch', NOW,
+        )
+        assert len(columns) == len(StorageManager._PAYMENT_COLUMNS)
+        assert columns[:3] == [['batch', 'batch'], ['RETAIL', 'RETAIL'], [NOW, NOW]]
+
+    def test_credit_columns(self):
+        records = [
+            {
+                'loan_account_number': 'LOAN_001',
+                'days_past_due': '3',
+                'final_maturity_date': date(2030, 1, 1),
+                'original_loan_amount': '1000.50',
+                'nominal_interest_rate': Decimal('0.015'),
+                'kkdf_rate': 0.1,
+                'internal_rating': '',
+                'external_rating': 'None',
+                'default_probability': '',
+                'customer_region_code': '',
+                'insurance_included': 1,
+            },
+            {},
+            {
+                'days_past_due': -5,
+                'original_loan_amount': None,
+                'kkdf_rate': 'bad',
+                'internal_rating': 'x',
+                'external_rating': '7',
+                'default_probability': 'None',
+                'customer_region_code': 'R1',
+            },
+        ]
+        fields = manager._CREDIT_FIELDS
+        columns = manager._build_columns(records, fields, 'RETAIL', 'batch', NOW)
+        col = lambda key: self._column(columns, fields, key)
+
+        assert len(columns) == len(StorageManager._CREDIT_COLUMNS)
+        assert col('loan_account_number') == ['LOAN_001', '', '']
+        assert col('days_past_due') == [3, 0, 0]
+        assert col('installment_frequency') == [1, 1, 1]
+        assert col('final_maturity_date') == [date(2030, 1, 1), None, None]
+        # Decimals keep the given digits; floats go through str(), not binary
+        assert col('original_loan_amount') == [Decimal('1000.50'), Decimal('0'), Decimal('0')]
+        assert str(col('original_loan_amount')[0]) == '1000.50'
+        assert col('nominal_interest_rate') == [Decimal('0.015'), Decimal('0'), Decimal('0')]
+        assert col('kkdf_rate') == [Decimal('0.1'), Decimal('0'), Decimal('0')]
+        # '' and 'None' become NULL in Nullable columns
+        assert col('internal_rating') == [None, None, None]
+        assert col('external_rating') == [None, None, 7]
+        assert col('default_probability') == [None, None, None]
+        assert col('customer_region_code') == [None, None, 'R1']
+        assert col('insurance_included') == [1, None, None]
+
+    def test_payment_columns(self):
+        records = [
+            {
+                'loan_account_number': 'LOAN_001',
+                'installment_number': '2',
+                'installment_amount': '500',
+                'remaining_principal': '0.005',
+                'installment_status': 'CLOSED',
+                'actual_payment_date': date(2024, 1, 1),
+            },
+            {},
+        ]
+        fields = manager._PAYMENT_FIELDS
+        columns = manager._build_columns(records, fields, 'RETAIL', 'batch', NOW)
+        col = lambda key: self._column(columns, fields, key)
+
+        assert len(columns) == len(StorageManager._PAYMENT_COLUMNS)
+        assert col('loan_account_number') == ['LOAN_001', '']
+        assert col('installment_number') == [2, 0]
+        assert col('actual_payment_date') == [date(2024, 1, 1), None]
+        assert col('installment_amount') == [Decimal('500'), Decimal('0')]
+        assert str(col('remaining_principal')[0]) == '0.005'
+        assert col('installment_status') == ['CLOSED', '']
+
+
+class _RecordingClient:
+    def __init__(self):
+        self.inserted = []
+
+    def insert(self, data, context):
+        self.inserted.append(len(data[0]))
+
+
+class TestInsertBatches:
+    def test_all_batches_inserted_in_order(self):
+        sm = StorageManager('bank001_dw')
+        sm.INSERT_BATCH_SIZE = 2
+        client = _RecordingClient()
+        records = [{'loan_account_number': f'LOAN_{i}'} for i in range(5)]
+        total = sm._insert_batches(
+            client, None, records, manager._PAYMENT_FIELDS, 'RETAIL', 'batch', NOW,
+        )
+        assert total == 5
+        assert client.inserted == [2, 2, 1]
+
+    def test_insert_staging_uses_own_client(self):
+        sm = StorageManager('bank001_dw')
+        sm.INSERT_BATCH_SIZE = 2
+        client = _RecordingClient()
+        sm._get_client = lambda: client
+        records = [{'loan_account_number': f'LOAN_{i}'} for i in range(3)]
+        total = sm.insert_staging(
+            None, records, manager._PAYMENT_FIELDS, 'RETAIL', 'batch', NOW,
+        )
+        assert total == 3
+        assert client.inserted == [2, 1]
+
+
+class TestPartitionLiteral:
+    def test_known_loan_type_is_quoted(self):
+        assert manager._partition_literal('RETAIL') == "'RETAIL'"
+
+    def test_unknown_loan_type_rejected(self):
+        with pytest.raises(ValueError):
+            manager._partition_literal("RETAIL' OR 1=1 --")
@@ -0,0 +1,256 @@
+"""Tests for SyncEngine locking, staging and its validation-error COPY stream."""
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from adapter.sync import engine
+from adapter.sync.engine import SyncEngine, _PhaseState, _copy_text
+
+
+class TestCopyText:
+    def test_none_is_null_marker(self):
+        assert _copy_text(None) == '\\N'
+
+    def test_plain_values(self):
+        assert _copy_text('LOAN_001') == 'LOAN_001'
+        assert _copy_text(12) == '12'
+        assert _copy_text('') == ''
+
+    def test_special_characters_escaped(self):
+        assert _copy_text('a\\b') == 'a\\\\b'
+        assert _copy_text('a\tb') == 'a\\tb'
+        assert _copy_text('a\nb') == 'a\\nb'
+        assert _copy_text('a\rb') == 'a\\rb'
+
+    def test_backslash_escaped_before_control_characters(self):
+        # A literal backslash followed by 't' must not turn into a tab
+        assert _copy_text('\\t\t') == '\\\\t\\t'
+
+    def test_literal_null_marker_text_is_not_null(self):
+        assert _copy_text('\\N') == '\\\\N'
+
+
+class TestSaveErrorsBatched:
+    def setup_method(self):
+        # Only the COPY helper is exercised; no tenant/ClickHouse setup needed
+        self.engine = SyncEngine.__new__(SyncEngine)
+        self.sync_log = SimpleNamespace(pk=uuid.UUID(int=1))
+
+    def _save(self, errors, file_type='credit'):
+        buffers = []
+        with patch.object(engine, 'connection') as connection:
+            cursor = connection.cursor.return_value.__enter__.return_value
+            cursor.copy_expert.side_effect = (
+                lambda sql, buf: buffers.append((sql, buf.getvalue()))
+            )
+            self.engine._save_errors_batched(self.sync_log, errors, file_type)
+        return buffers
+
+    def test_line_has_columns_in_copy_order(self):
+        errors = [{
+            'row_number': 7,
+            'field_name': 'kkdf_rate',
+            'error_type': 'TYPE',
+            'error_message': 'kkdf_rate must be a number, got: 1\t2\n3',
+            'raw_value': 'C:\\data\r',
+        }]
+        [(sql, data)] = self._save(errors)
+
+        columns = sql[sql.index('(') + 1:sql.index(')')].split(', ')
+        assert columns == [
+            'sync_log_id', 'row_number', 'file_type', 'field_name',
+            'error_type', 'error_message', 'raw_value',
+        ]
+        lines = data.split('\n')
+        assert lines[-1] == ''
+        [line] = lines[:-1]
+        fields = line.split('\t')
+        assert len(fields) == len(columns)
+        assert dict(zip(columns, fields)) == {
+            'sync_log_id': str(uuid.UUID(int=1)),
+            'row_number': '7',
+            'file_type': 'credit',
+            'field_name': 'kkdf_rate',
+            'error_type': 'TYPE',
+            'error_message': 'kkdf_rate must be a number, got: 1\\t2\\n3',
+            'raw_value': 'C:\\\\data\\r',
+        }
+
+    def test_missing_raw_value_written_as_null(self):
+        errors = [{
+            'row_number': 1,
+            'field_name': 'loan_account_number',
+            'error_type': 'REQUIRED',
+            'error_message': 'loan_account_number is required',
+        }]
+        [(_, data)] = self._save(errors, 'payment_plan')
+        assert data.rstrip('\n').split('\t')[-1] == '\\N'
+
+    def test_one_copy_per_batch(self):
+        errors = [
+            {'row_number': i, 'field_name': 'f', 'error_type': 'TYPE',
+             'error_message': 'm', 'raw_value': None}
+            for i in range(1, 4)
+        ]
+        with patch.object(engine, 'ERROR_SAVE_BATCH', 2):
+            buffers = self._save(errors)
+        assert [data.count('\n') for _, data in buffers] == [2, 1]
+
+    def test_no_errors_no_copy(self):
+        assert self._save([]) == []
+
+
+class TestStage:
+    def setup_method(self):
+        self.engine = SyncEngine.__new__(SyncEngine)
+        self.engine.batch_id = 'batch'
+        self.engine.storage_manager = MagicMock(INSERT_BATCH_SIZE=3)
+        self.engine.storage_manager.insert_staging.side_effect = (
+            lambda context, records, *args: len(records)
+        )
+        self.state = _PhaseState('credit', (), None, 'ctx')
+
+    def _inserted(self):
+        return [
+            [r['i'] for r in c.args[1]]
+            for c in self.engine.storage_manager.insert_staging.call_args_list
+        ]
+
+    def _stage(self, rows, final=False):
+        self.state.pending += [{'i': i} for i in rows]
+        self.engine._stage(None, self.state, 'RETAIL', final=final)
+
+    def test_partial_batch_waits_for_more_rows(self):
+        self._stage(range(2))
+        assert self._inserted() == []
+        assert len(self.state.pending) == 2
+
+    def test_only_whole_batches_inserted(self):
+        self._stage(range(7))
+        assert self._inserted() == [[0, 1, 2, 3, 4, 5]]
+        assert self.state.pending == [{'i': 6}]
+        assert self.state.valid_count == 6
+
+    def test_final_flushes_remainder(self):
+        self._stage(range(4))
+        self._stage(range(4, 5), final=True)
+        assert self._inserted() == [[0, 1, 2], [3, 4]]
+        assert self.state.pending == []
+        assert self.state.valid_count == 5
+
+
+LOCK_KEY = 'sync_lock:BANK001:RETAIL'
+WAKE_KEY = 'sync_lock_wake:BANK001:RETAIL'
+
+
+class _FakeRedis:
+    """
+    In-memory stand-in for the lock commands SyncEngine uses. eval() runs
+    the same steps as _RELEASE_LOCK_LUA: compare-and-delete, then RPUSH a
+    wake token and EXPIRE it.
+    """
+
+    def __init__(self, on_block=None):
+        self.values = {}
+        self.lists = {}
+        self.expires = {}
+        self.set_calls = 0
+        self.blpop_calls = 0
+        self.on_block = on_block  # Runs when BLPOP finds no token
+
+    def set(self, key, value, nx=False, ex=None):
+        self.set_calls += 1
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    def blpop(self, key, timeout=0):
+        self.blpop_calls += 1
+        if not self.lists.get(key) and self.on_block:
+            self.on_block(self)
+        if self.lists.get(key):
+            return key, self.lists[key].pop(0)
+        return None
+
+    def eval(self, script, numkeys, *args):
+        assert script == engine._RELEASE_LOCK_LUA
+        (lock_key, wake_key), (owner, wake_ttl) = args[:numkeys], args[numkeys:]
+        if self.values.get(lock_key) != owner:
+            return 0
+        del self.values[lock_key]
+        self.lists.setdefault(wake_key, []).append('1')
+        self.expires[wake_key] = wake_ttl
+        return 1
+
+
+def _release_by(owner):
+    def release(r):
+        r.eval(engine._RELEASE_LOCK_LUA, 2, LOCK_KEY, WAKE_KEY, owner, 60)
+    return release
+
+
+class TestSyncLock:
+    def setup_method(self):
+        # The pipeline fails right after the lock is taken, so only the
+        # acquire/release paths run.
+        self.engine = SyncEngine.__new__(SyncEngine)
+        self.engine.tenant_id = 'BANK001'
+        self.engine.batch_id = 'mine'
+        self.engine.fetcher = MagicMock()
+        self.engine.fetcher.fetch_row_count.side_effect = RuntimeError('stop')
+        self.engine.storage_manager = MagicMock()
+        self.engine._update_sync_config = MagicMock()
+
+    def _sync(self, r, wait_for_lock=True):
+        self.engine._get_redis = lambda: r
+        with patch.multiple(
+            engine, SyncLog=MagicMock(), invalidate_after_sync=MagicMock(),
+            sync_operations_total=MagicMock(), sync_duration_seconds=MagicMock(),
+        ):
+            self.engine.sync('RETAIL', wait_for_lock=wait_for_lock)
+
+    def test_release_script_guards_delete_with_owner_check(self):
+        script = engine._RELEASE_LOCK_LUA
+        guard = script.index("redis.call('get', KEYS[1]) == ARGV[1]")
+        assert guard < script.index("redis.call('del', KEYS[1])")
+        assert guard < script.index("redis.call('rpush', KEYS[2]")
+
+    def test_release_deletes_owned_lock_and_pushes_wake_token(self):
+        r = _FakeRedis()
+        self._sync(r)
+        assert LOCK_KEY not in r.values
+        assert r.lists[WAKE_KEY] == ['1']
+        assert r.expires[WAKE_KEY] == engine.SYNC_LOCK_WAKE_TTL
+
+    def test_release_keeps_lock_taken_over_by_another_sync(self):
+        r = _FakeRedis()
+
+        def lock_expired_and_taken(*args):
+            r.values[LOCK_KEY] = 'other'
+            raise RuntimeError('stop')
+
+        self.engine.fetcher.fetch_row_count.side_effect = lock_expired_and_taken
+        self._sync(r)
+        assert r.values[LOCK_KEY] == 'other'
+        assert WAKE_KEY not in r.lists
+
+    def test_waiter_retries_after_stale_wake_token(self):
+        r = _FakeRedis(on_block=_release_by('other'))
+        r.values[LOCK_KEY] = 'other'
+        r.lists[WAKE_KEY] = ['1']  # Left over from an earlier release
+        self._sync(r)
+        # Stale token popped but SET NX failed; the real release then woke us
+        assert r.blpop_calls == 2
+        assert r.set_calls == 3
+        # Our own release leaves a token for the next waiter
+        assert LOCK_KEY not in r.values
+        assert r.lists[WAKE_KEY] == ['1']
+
+    def test_no_wait_fails_without_blocking(self):
+        r = _FakeRedis()
+        r.values[LOCK_KEY] = 'other'
+        self._sync(r, wait_for_lock=False)
+        assert r.blpop_calls == 0
+        assert r.values[LOCK_KEY] == 'other'
+        self.engine.fetcher.fetch_row_count.assert_not_called()
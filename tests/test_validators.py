@@ -3,8 +3,8 @@ import pytest
 from decimal import Decimal
 
 from adapter.validators.field_validators import CreditFieldValidator, PaymentFieldValidator
-from adapter.normalizers.date_normalizer import DateNormalizer
-from adapter.normalizers.rate_normalizer import RateNormalizer
+from adapter.normalizers.date_normalizer import DateNormalizer, normalize_date
+from adapter.normalizers.rate_normalizer import RateNormalizer, normalize_rate
 from adapter.normalizers.category_normalizer import CategoryNormalizer
 
 
@@ -74,6 +74,18 @@ class TestCreditFieldValidator:
         assert not result.is_valid
         assert any(e['field_name'] == 'original_loan_amount' for e in result.errors)
 
+    def test_rate_above_storage_range(self):
+        row = self._make_row(kkdf_rate='100000')
+        result = self.validator.validate_row(row, 1, 'RETAIL')
+        assert not result.is_valid
+        assert [(e['field_name'], e['error_type']) for e in result.errors] == [
+            ('kkdf_rate', 'RANGE'),
+        ]
+
+    def test_rate_at_storage_limit_accepted(self):
+        row = self._make_row(nominal_interest_rate='99999.99')
+        assert self.validator.validate_row(row, 1, 'RETAIL').is_valid
+
     def test_invalid_date_format(self):
         row = self._make_row(final_maturity_date='2025/03/02')
         result = self.validator.validate_row(row, 1, 'RETAIL')
@@ -172,6 +184,13 @@ class TestDateNormalizer:
         result = self.normalizer.normalize_credit(record)
         assert result['final_maturity_date'] is None
 
+    def test_invalid_calendar_date(self):
+        from datetime import date
+        record = {'actual_payment_date': '20250230', 'scheduled_payment_date': ' 2025-02-08 '}
+        result = self.normalizer.normalize_payment(record)
+        assert result['actual_payment_date'] is None
+        assert result['scheduled_payment_date'] == date(2025, 2, 8)
+
 
 class TestRateNormalizer:
     def setup_method(self):
@@ -211,6 +230,51 @@ class TestRateNormalizer:
         assert result['default_probability'] == Decimal('0.0217')
 
 
+
+class TestNormalizeDate:
+    def test_formats(self):
+        from datetime import date
+        assert normalize_date('20250302') == date(2025, 3, 2)
+        assert normalize_date('2025-03-02') == date(2025, 3, 2)
+        assert normalize_date(' 20250302 ') == date(2025, 3, 2)
+
+    def test_empty_and_invalid(self):
+        for value in ('', '   ', None, 'abc', '2025030', '20251301', '2025-02-30'):
+            assert normalize_date(value) is None
+
+    def test_non_string_values_converted(self):
+        from datetime import date
+        assert normalize_date(20250302) == date(2025, 3, 2)
+        assert normalize_date(date(2025, 3, 2)) == date(2025, 3, 2)
+
+    def test_unhashable_value_is_invalid(self):
+        assert normalize_date(['20250302']) is None
+
+
+class TestNormalizeRate:
+    def test_percentage_and_fraction(self):
+        assert normalize_rate('18.5') == Decimal('0.185')
+        assert normalize_rate('0.0514') == Decimal('0.0514')
+        assert normalize_rate('1') == Decimal('1')
+        assert normalize_rate(' 5.14 ') == Decimal('0.0514')
+
+    def test_empty_and_invalid(self):
+        for value in ('', '   ', None, 0, 'abc', 'NaN%'):
+            assert normalize_rate(value) == Decimal('0')
+
+    def test_equal_values_of_other_types_not_shared(self):
+        # With a plain lru_cache, 1, 1.0 and True hash alike and would
+        # return whichever result was cached first.
+        assert normalize_rate(True) == Decimal('0')
+        assert normalize_rate(1) == Decimal('1')
+        assert str(normalize_rate(1.0)) == '1.0'
+        assert str(normalize_rate(1)) == '1'
+
+    def test_unhashable_value_is_invalid(self):
+        assert normalize_rate(['18.5']) == Decimal('0')
+        assert normalize_rate({'rate': '18.5'}) == Decimal('0')
+
+
 class TestCategoryNormalizer:
     def setup_method(self):
         self.normalizer = CategoryNormalizer()